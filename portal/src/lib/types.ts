@@ -181,6 +181,7 @@ export interface ScrapeProgress {
 	messages_scraped: number;
 	attachments_found: number;
 	errors: string[];
+	errors_truncated: number;
 }
 
 export interface ScrapeJob {
@@ -7,6 +7,7 @@ from pathlib import Path
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
 
 from wumpus_archiver.api.scrape_manager import ScrapeJobManager
@@ -36,6 +37,7 @@ def create_app(
         """Manage application lifecycle."""
         await database.connect()
         yield
+        await app.state.scrape_manager.shutdown()
         await database.disconnect()
 
     app = FastAPI(
@@ -54,6 +56,9 @@ def create_app(
         allow_headers=["*"],
     )
 
+    # JSON listings (messages, search, users) are repetitive text and compress well
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
     # Store database on app state
     app.state.database = database
 
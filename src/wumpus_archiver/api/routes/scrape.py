@@ -1,9 +1,7 @@
 """Scrape control panel API route handlers."""
 
-from datetime import UTC, datetime
-
 from fastapi import APIRouter, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 
 from wumpus_archiver.api.schemas import (
     ScrapeHistoryResponse,
@@ -22,29 +20,29 @@ def _get_scrape_manager(request: Request):  # type: ignore[no-untyped-def]
 
 
 def _job_to_schema(job) -> ScrapeJobSchema:  # type: ignore[no-untyped-def]
-    """Convert a ScrapeJob model to a response schema."""
-    duration: float | None = None
-    if job.started_at and job.completed_at:
-        duration = (job.completed_at - job.started_at).total_seconds()
-    elif job.started_at:
-        duration = (datetime.now(UTC) - job.started_at).total_seconds()
-
-    return ScrapeJobSchema(
+    """Convert a ScrapeJob model to a response schema.
+
+    Values come straight from the typed in-process job, so validation is
+    skipped via ``model_construct``.
+    """
+    progress = job.progress
+    return ScrapeJobSchema.model_construct(
         id=job.id,
         guild_id=job.guild_id,
         status=job.status.value,
-        progress=ScrapeProgressSchema(
-            current_channel=job.progress.current_channel,
-            channels_done=job.progress.channels_done,
-            messages_scraped=job.progress.messages_scraped,
-            attachments_found=job.progress.attachments_found,
-            errors=job.progress.errors,
+        progress=ScrapeProgressSchema.model_construct(
+            current_channel=progress.current_channel,
+            channels_done=progress.channels_done,
+            messages_scraped=progress.messages_scraped,
+            attachments_found=progress.attachments_found,
+            errors=progress.errors,
+            errors_truncated=progress.errors_truncated,
         ),
-        started_at=job.started_at.isoformat() if job.started_at else None,
-        completed_at=job.completed_at.isoformat() if job.completed_at else None,
+        started_at=job.started_at_iso,
+        completed_at=job.completed_at_iso,
         result=job.result,
         error_message=job.error_message,
-        duration_seconds=round(duration, 1) if duration is not None else None,
+        duration_seconds=job.duration_seconds,
     )
 
 
@@ -106,10 +104,15 @@ async def scrape_cancel(request: Request) -> JSONResponse:
     )
 
 
+def _job_json(job) -> bytes:  # type: ignore[no-untyped-def]
+    """Serialize a job as a JSON response entry."""
+    return _job_to_schema(job).model_dump_json().encode()
+
+
 @router.get("/scrape/history", response_model=ScrapeHistoryResponse)
-async def scrape_history(request: Request) -> ScrapeHistoryResponse:
+async def scrape_history(request: Request) -> Response:
     """Get scrape job history."""
     manager = _get_scrape_manager(request)
-    return ScrapeHistoryResponse(
-        jobs=[_job_to_schema(j) for j in manager.history],
-    )
+    # Archived jobs cache their bytes, so later polls skip re-serializing them
+    body = b",".join(j.history_json(_job_json) for j in manager.history)
+    return Response(content=b'{"jobs":[' + body + b"]}", media_type="application/json")
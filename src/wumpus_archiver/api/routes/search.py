@@ -1,6 +1,6 @@
 """Search API route handlers."""
 
-from fastapi import APIRouter, Query, Request
+from fastapi import APIRouter, Query, Request, Response
 
 from sqlalchemy import func, select
 from sqlalchemy.orm import selectinload
@@ -21,6 +21,7 @@ router = APIRouter()
 @router.get("/search", response_model=SearchResponse)
 async def search_messages(
     request: Request,
+    response: Response,
     q: str = Query(..., min_length=1, description="Search query"),
     guild_id: int | None = Query(None, description="Filter by guild"),
     channel_id: int | None = Query(None, description="Filter by channel"),
@@ -28,6 +29,8 @@ async def search_messages(
     limit: int = Query(50, ge=1, le=100, description="Max results"),
 ) -> SearchResponse:
     """Search messages by content."""
+    # Let polling clients reuse identical searches for a few seconds
+    response.headers["Cache-Control"] = "private, max-age=5"
     db = get_db(request)
     async with db.session() as session:
         query = (
@@ -1,10 +1,14 @@
 """User API route handlers."""
 
+import asyncio
 import datetime as dt
+import time
 
 from fastapi import APIRouter, Query, Request
 
-from sqlalchemy import func, select
+from sqlalchemy import Integer, Row, Select, cast, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
 from wumpus_archiver.api.routes._helpers import get_db, raise_not_found
 from wumpus_archiver.api.schemas import (
@@ -20,16 +24,59 @@ from wumpus_archiver.models.channel import Channel
 from wumpus_archiver.models.message import Message
 from wumpus_archiver.models.reaction import Reaction
 from wumpus_archiver.models.user import User
+from wumpus_archiver.storage.database import Database
 
 router = APIRouter()
 
+# Guild user listings only change when a scrape lands, so cache whole pages
+# briefly. Keys include the scrape manager's data version, which bumps after
+# every in-process scrape and so invalidates earlier entries; the short TTL
+# bounds staleness from scrapes run by the CLI in another process.
+USER_LIST_CACHE_TTL = 30.0
+USER_LIST_CACHE_MAX = 1024
+_user_list_cache: dict[tuple[object, ...], tuple[float, UserListResponse]] = {}
+
+MONTH_ABBRS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
+def _month_period(year_month: int | None) -> tuple[str, str]:
+    """Split an integer ``YYYYMM`` period into (``YYYY-MM``, ``Mon YYYY``)."""
+    if year_month is None:
+        return "None", "None"
+    year, month = divmod(int(year_month), 100)
+    period = f"{year:04d}-{month:02d}"
+    if not 1 <= month <= 12:
+        return period, period
+    return period, f"{MONTH_ABBRS[month - 1]} {year}"
+
+
+async def _fetch_rows[*Ts](db: Database, stmt: Select[*Ts]) -> list[Row[*Ts]]:
+    """Execute a read-only statement on a fresh session and return all rows."""
+    async with db.session() as session:
+        result = await session.execute(stmt)
+        return list(result.all())
+
+
+async def _guild_channel_ids(session: AsyncSession, guild_id: int) -> list[int]:
+    """Resolve a guild's channel IDs once per request.
+
+    Passing the IDs as an expanding ``IN`` list keeps SQLite from re-planning
+    the ``SELECT id FROM channels`` subquery inside every message query.
+    """
+    result = await session.execute(select(Channel.id).where(Channel.guild_id == guild_id))
+    return list(result.scalars().all())
+
 
 @router.get("/users/{user_id}", response_model=UserSchema)
 async def get_user(request: Request, user_id: int) -> UserSchema:
     """Get user details."""
     db = get_db(request)
     async with db.session() as session:
-        result = await session.execute(select(User).where(User.id == user_id))
+        # Only column data is serialized; turn any relationship access into an error
+        # rather than a silent per-row lazy load.
+        result = await session.execute(
+            select(User).where(User.id == user_id).options(raiseload("*"))
+        )
         user = result.scalar_one_or_none()
         if not user:
             raise_not_found("User not found")
@@ -50,12 +97,31 @@ async def list_guild_users(
 ) -> UserListResponse:
     """List users who have posted in a guild, with message counts."""
     db = get_db(request)
-    guild_channels = select(Channel.id).where(Channel.guild_id == guild_id)
+    manager = getattr(request.app.state, "scrape_manager", None)
+    cache_key = (
+        db.database_url,
+        getattr(manager, "data_version", 0),
+        guild_id,
+        offset,
+        limit,
+        sort,
+        q,
+    )
+    now = time.monotonic()
+    cached = _user_list_cache.get(cache_key)
+    if cached is not None and now - cached[0] < USER_LIST_CACHE_TTL:
+        return cached[1]
 
     async with db.session() as session:
+        guild_channels = await _guild_channel_ids(session, guild_id)
         base = (
             select(
-                User,
+                User.id,
+                User.username,
+                User.discriminator,
+                User.global_name,
+                User.avatar_url,
+                User.bot,
                 func.count(Message.id).label("message_count"),
                 func.min(Message.created_at).label("first_seen"),
                 func.max(Message.created_at).label("last_seen"),
@@ -65,10 +131,19 @@ async def list_guild_users(
             .group_by(User.id)
         )
 
+        # Count distinct posters directly rather than wrapping the grouped,
+        # ordered listing query in a subquery.
+        count_q = (
+            select(func.count(func.distinct(User.id)))
+            .select_from(User)
+            .join(Message, Message.author_id == User.id)
+            .where(Message.channel_id.in_(guild_channels))
+        )
+
         if q:
-            base = base.where(
-                User.username.ilike(f"%{q}%") | User.global_name.ilike(f"%{q}%")
-            )
+            name_match = User.username.ilike(f"%{q}%") | User.global_name.ilike(f"%{q}%")
+            base = base.where(name_match)
+            count_q = count_q.where(name_match)
 
         if sort == "name":
             base = base.order_by(User.username.asc())
@@ -77,41 +152,60 @@ async def list_guild_users(
         else:
             base = base.order_by(func.count(Message.id).desc())
 
-        count_q = select(func.count()).select_from(base.subquery())
         total_result = await session.execute(count_q)
-        total = total_result.scalar() or 0
+        total = total_result.scalar_one()
 
+        # Stream rows straight into schemas rather than materializing the page
+        # first; the extra (limit + 1)th row only signals has_more.
         query = base.offset(offset).limit(limit + 1)
-        result = await session.execute(query)
-        rows = result.all()
-
-        has_more = len(rows) > limit
-        if has_more:
-            rows = rows[:limit]
-
-        users = []
-        for user, msg_count, first_seen, last_seen in rows:
-            item = UserListItem(
-                id=user.id,
-                username=user.username,
-                discriminator=user.discriminator,
-                global_name=user.global_name,
-                avatar_url=user.avatar_url,
-                bot=user.bot,
-                display_name=user.global_name or user.username,
-                message_count=msg_count,
-                first_seen=first_seen,
-                last_seen=last_seen,
+        result = await session.stream(query)
+
+        # Rows come from typed columns, so skip per-field validation
+        users: list[UserListItem] = []
+        has_more = False
+        async for (
+            uid,
+            username,
+            discriminator,
+            global_name,
+            avatar_url,
+            bot,
+            msg_count,
+            first_seen,
+            last_seen,
+        ) in result:
+            if len(users) == limit:
+                has_more = True
+                break
+            users.append(
+                UserListItem.model_construct(
+                    id=uid,
+                    username=username,
+                    discriminator=discriminator,
+                    global_name=global_name,
+                    avatar_url=avatar_url,
+                    bot=bot,
+                    display_name=global_name or username,
+                    message_count=msg_count,
+                    first_seen=first_seen,
+                    last_seen=last_seen,
+                )
             )
-            users.append(item)
+        await result.close()
 
-        return UserListResponse(
+        response = UserListResponse(
             users=users,
             total=total,
             has_more=has_more,
             offset=offset,
         )
 
+    if len(_user_list_cache) >= USER_LIST_CACHE_MAX:
+        # Drop the oldest entry (dicts keep insertion order)
+        _user_list_cache.pop(next(iter(_user_list_cache)))
+    _user_list_cache[cache_key] = (now, response)
+    return response
+
 
 @router.get("/users/{user_id}/profile", response_model=UserProfileSchema)
 async def get_user_profile(
@@ -122,135 +216,135 @@ async def get_user_profile(
     """Get detailed user profile with statistics."""
     db = get_db(request)
     async with db.session() as session:
-        user_result = await session.execute(select(User).where(User.id == user_id))
+        user_result = await session.execute(
+            select(User).where(User.id == user_id).options(raiseload("*"))
+        )
         user = user_result.scalar_one_or_none()
         if not user:
             raise_not_found("User not found")
 
         if guild_id:
-            guild_channels = select(Channel.id).where(Channel.guild_id == guild_id)
+            guild_channels = await _guild_channel_ids(session, guild_id)
             msg_scope = Message.channel_id.in_(guild_channels)
         else:
             msg_scope = True  # type: ignore[assignment]
 
-        user_msgs = select(Message).where(
-            Message.author_id == user_id,
-            msg_scope,
-        ).subquery()
-
-        total_msgs_r = await session.execute(
-            select(func.count()).select_from(user_msgs)
-        )
-        total_messages = total_msgs_r.scalar() or 0
-
-        total_att_r = await session.execute(
-            select(func.count(Attachment.id)).where(
-                Attachment.message_id.in_(select(user_msgs.c.id))
-            )
-        )
-        total_attachments = total_att_r.scalar() or 0
-
-        total_reactions_r = await session.execute(
-            select(func.coalesce(func.sum(Reaction.count), 0)).where(
-                Reaction.message_id.in_(select(user_msgs.c.id))
-            )
+    user_filter = (Message.author_id == user_id, msg_scope)
+    # The user's message IDs, written once as a CTE and shared by the
+    # attachment/reaction lookups instead of re-scanning messages each time.
+    user_msg_ids = select(Message.id).where(*user_filter).cte("user_msg_ids")
+
+    # Scalar stats in one round-trip; attachment/reaction totals ride along
+    # as scalar subqueries over the CTE. COUNT never yields NULL and the
+    # nullable aggregates are coalesced, so rows need no Python defaulting.
+    attachments_q = (
+        select(func.count(Attachment.id))
+        .where(Attachment.message_id.in_(select(user_msg_ids.c.id)))
+        .scalar_subquery()
+    )
+    reactions_q = (
+        select(func.coalesce(func.sum(Reaction.count), 0))
+        .where(Reaction.message_id.in_(select(user_msg_ids.c.id)))
+        .scalar_subquery()
+    )
+    agg_q = select(
+        func.count(Message.id),
+        func.min(Message.created_at),
+        func.max(Message.created_at),
+        func.coalesce(func.avg(func.length(Message.content)), 0),
+        func.count(func.distinct(Message.channel_id)),
+        attachments_q,
+        reactions_q,
+    ).where(*user_filter)
+
+    top_ch_q = (
+        select(
+            Channel.id,
+            Channel.name,
+            func.count(Message.id).label("cnt"),
         )
-        total_reactions_received = total_reactions_r.scalar() or 0
-
-        time_r = await session.execute(
-            select(
-                func.min(user_msgs.c.created_at),
-                func.max(user_msgs.c.created_at),
-            )
+        .join(Message, Message.channel_id == Channel.id)
+        .where(*user_filter)
+        .group_by(Channel.id, Channel.name)
+        .order_by(func.count(Message.id).desc())
+        .limit(10)
+    )
+
+    cutoff = dt.datetime.now(dt.UTC) - dt.timedelta(days=730)
+    monthly_q = (
+        select(
+            # Integer YYYYMM groups and sorts cheaper than a text period
+            cast(func.strftime("%Y%m", Message.created_at), Integer).label("period"),
+            func.count(Message.id).label("cnt"),
         )
-        first_msg_at, last_msg_at = time_r.one()
-
-        avg_len_r = await session.execute(
-            select(func.avg(func.length(user_msgs.c.content)))
-        )
-        avg_message_length = round(float(avg_len_r.scalar() or 0), 1)
-
-        active_ch_r = await session.execute(
-            select(func.count(func.distinct(user_msgs.c.channel_id)))
-        )
-        active_channels = active_ch_r.scalar() or 0
-
-        top_ch_r = await session.execute(
-            select(
-                Channel.id,
-                Channel.name,
-                func.count(Message.id).label("cnt"),
-            )
-            .join(Message, Message.channel_id == Channel.id)
-            .where(Message.author_id == user_id, msg_scope)
-            .group_by(Channel.id, Channel.name)
-            .order_by(func.count(Message.id).desc())
-            .limit(10)
+        .where(*user_filter, Message.created_at >= cutoff)
+        .group_by("period")
+        .order_by("period")
+    )
+
+    top_react_q = (
+        select(
+            Reaction.emoji_name,
+            func.sum(Reaction.count).label("total"),
         )
-        top_channels = [
-            UserChannelActivity(
-                channel_id=ch_id,
-                channel_name=ch_name,
-                message_count=cnt,
-            )
-            for ch_id, ch_name, cnt in top_ch_r.all()
-        ]
-
-        cutoff = dt.datetime.now(dt.UTC) - dt.timedelta(days=730)
-        monthly_r = await session.execute(
-            select(
-                func.strftime("%Y-%m", Message.created_at).label("period"),
-                func.count(Message.id).label("cnt"),
-            )
-            .where(
-                Message.author_id == user_id,
-                msg_scope,
-                Message.created_at >= cutoff,
-            )
-            .group_by("period")
-            .order_by("period")
+        .where(Reaction.message_id.in_(select(user_msg_ids.c.id)))
+        .group_by(Reaction.emoji_name)
+        .order_by(func.sum(Reaction.count).desc())
+        .limit(10)
+    )
+
+    # The queries are independent, so run each on its own pooled connection
+    # and wait for the slowest rather than the sum.
+    agg_rows, top_ch_rows, monthly_rows, top_react_rows = await asyncio.gather(
+        _fetch_rows(db, agg_q),
+        _fetch_rows(db, top_ch_q),
+        _fetch_rows(db, monthly_q),
+        _fetch_rows(db, top_react_q),
+    )
+
+    (
+        total_messages,
+        first_msg_at,
+        last_msg_at,
+        avg_len,
+        active_channels,
+        total_attachments,
+        total_reactions_received,
+    ) = agg_rows[0]
+    avg_message_length = round(float(avg_len), 1)
+
+    monthly_activity = []
+    for year_month, cnt in monthly_rows:
+        period, label = _month_period(year_month)
+        monthly_activity.append(
+            UserMonthlyActivity.model_construct(period=period, label=label, count=cnt)
         )
-        monthly_activity = []
-        for period, cnt in monthly_r.all():
-            try:
-                label = dt.datetime.strptime(period, "%Y-%m").strftime("%b %Y")
-            except (ValueError, TypeError):
-                label = str(period)
-            monthly_activity.append(
-                UserMonthlyActivity(period=period, label=label, count=cnt)
-            )
 
-        top_react_r = await session.execute(
-            select(
-                Reaction.emoji_name,
-                func.sum(Reaction.count).label("total"),
+    # Every value comes from typed columns, so skip validation on construction
+    return UserProfileSchema.model_construct(
+        id=user.id,
+        username=user.username,
+        discriminator=user.discriminator,
+        global_name=user.global_name,
+        avatar_url=user.avatar_url,
+        bot=user.bot,
+        display_name=user.global_name or user.username,
+        total_messages=total_messages,
+        total_attachments=total_attachments,
+        total_reactions_received=total_reactions_received,
+        first_message_at=first_msg_at,
+        last_message_at=last_msg_at,
+        active_channels=active_channels,
+        avg_message_length=avg_message_length,
+        top_channels=[
+            UserChannelActivity.model_construct(
+                channel_id=ch_id, channel_name=ch_name, message_count=cnt
             )
-            .where(Reaction.message_id.in_(select(user_msgs.c.id)))
-            .group_by(Reaction.emoji_name)
-            .order_by(func.sum(Reaction.count).desc())
-            .limit(10)
-        )
-        top_reactions_received = [
-            {"emoji": name or "?", "count": int(total)}
-            for name, total in top_react_r.all()
-        ]
-
-        return UserProfileSchema(
-            id=user.id,
-            username=user.username,
-            discriminator=user.discriminator,
-            global_name=user.global_name,
-            avatar_url=user.avatar_url,
-            bot=user.bot,
-            display_name=user.global_name or user.username,
-            total_messages=total_messages,
-            total_attachments=total_attachments,
-            total_reactions_received=total_reactions_received,
-            first_message_at=first_msg_at,
-            last_message_at=last_msg_at,
-            active_channels=active_channels,
-            avg_message_length=avg_message_length,
-            top_channels=top_channels,
-            monthly_activity=monthly_activity,
-            top_reactions_received=top_reactions_received,
-        )
+            for ch_id, ch_name, cnt in top_ch_rows
+        ],
+        monthly_activity=monthly_activity,
+        top_reactions_received=[
+            {"emoji": name or "?", "count": int(total)} for name, total in top_react_rows
+        ],
+        top_words=[],
+    )
@@ -5,11 +5,22 @@ from typing import Annotated
 
 from pydantic import BaseModel, ConfigDict, PlainSerializer
 
+
+def _snowflake_str(v: int) -> str:
+    """Serialize a snowflake ID as a string."""
+    return str(v)
+
+
+def _optional_snowflake_str(v: int | None) -> str | None:
+    """Serialize an optional snowflake ID as a string, preserving None."""
+    return None if v is None else str(v)
+
+
 # Discord snowflake IDs exceed JavaScript's Number.MAX_SAFE_INTEGER (2^53-1).
 # Serialize them as strings so the frontend doesn't lose precision.
-Snowflake = Annotated[int, PlainSerializer(lambda v: str(v), return_type=str)]
+Snowflake = Annotated[int, PlainSerializer(_snowflake_str, return_type=str)]
 OptionalSnowflake = Annotated[
-    int | None, PlainSerializer(lambda v: str(v) if v is not None else None, return_type=str | None)
+    int | None, PlainSerializer(_optional_snowflake_str, return_type=str | None)
 ]
 
 
@@ -225,6 +236,7 @@ class ScrapeProgressSchema(BaseModel):
     messages_scraped: int = 0
     attachments_found: int = 0
     errors: list[str] = []
+    errors_truncated: int = 0
 
 
 class ScrapeJobSchema(BaseModel):
@@ -1,19 +1,39 @@
 """Background scrape job manager for the API."""
 
 import asyncio
+import contextlib
+import hashlib
 import logging
+import time
 import uuid
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
-from typing import Any
+from typing import Any, cast
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, PrivateAttr
 
 from wumpus_archiver.bot.scraper import ArchiverBot
 from wumpus_archiver.storage.database import Database
 
 logger = logging.getLogger(__name__)
 
+# Completed jobs kept for the history endpoint; older ones fall off the end
+MAX_HISTORY = 50
+
+# Error messages kept on a job's progress; the rest are only counted
+MAX_PROGRESS_ERRORS = 100
+
+# Seconds a connected bot is kept after a successful job so back-to-back
+# scrapes skip the gateway handshake. Holding it occupies one of the bot
+# token's concurrent gateway sessions for that long.
+WARM_BOT_TTL = 120.0
+
+# Minimum seconds between progress writes from the scraper callback (10 Hz)
+PROGRESS_MIN_INTERVAL = 0.1
+
 
 class JobStatus(str, Enum):
     """Scrape job status."""
@@ -26,14 +46,20 @@ class JobStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
-class ScrapeProgress(BaseModel):
-    """Progress data for a running scrape job."""
+@dataclass(slots=True)
+class ScrapeProgress:
+    """Progress data for a running scrape job.
+
+    A plain slotted dataclass rather than a model: it is internal state that is
+    mutated from the scraper callback and never parsed from input.
+    """
 
     current_channel: str = ""
     channels_done: int = 0
     messages_scraped: int = 0
     attachments_found: int = 0
-    errors: list[str] = []
+    errors: list[str] = field(default_factory=list)
+    errors_truncated: int = 0
 
 
 class ScrapeJob(BaseModel):
@@ -42,12 +68,70 @@ class ScrapeJob(BaseModel):
     id: str
     guild_id: int
     status: JobStatus = JobStatus.PENDING
-    progress: ScrapeProgress = ScrapeProgress()
+    progress: ScrapeProgress = Field(default_factory=ScrapeProgress)
     started_at: datetime | None = None
     completed_at: datetime | None = None
     result: dict[str, Any] | None = None
     error_message: str | None = None
 
+    # Memoized (datetime, isoformat) pairs — timestamps rarely change once set,
+    # so status/history polling shouldn't re-format them on every request.
+    _started_iso: tuple[datetime, str] | None = PrivateAttr(default=None)
+    _completed_iso: tuple[datetime, str] | None = PrivateAttr(default=None)
+    _duration: tuple[datetime, float] | None = PrivateAttr(default=None)
+    # Serialized response entry, filled once the job is archived to history
+    _history_json: bytes | None = PrivateAttr(default=None)
+
+    @property
+    def started_at_iso(self) -> str | None:
+        """ISO-8601 start timestamp, cached per ``started_at`` value."""
+        if self.started_at is None:
+            return None
+        if self._started_iso is None or self._started_iso[0] is not self.started_at:
+            self._started_iso = (self.started_at, self.started_at.isoformat())
+        return self._started_iso[1]
+
+    @property
+    def completed_at_iso(self) -> str | None:
+        """ISO-8601 completion timestamp, cached per ``completed_at`` value."""
+        if self.completed_at is None:
+            return None
+        if self._completed_iso is None or self._completed_iso[0] is not self.completed_at:
+            self._completed_iso = (self.completed_at, self.completed_at.isoformat())
+        return self._completed_iso[1]
+
+    @property
+    def duration_seconds(self) -> float | None:
+        """Elapsed seconds, rounded to 0.1s (live for running jobs)."""
+        if self.started_at is None:
+            return None
+        if self.completed_at is None:
+            return round((datetime.now(UTC) - self.started_at).total_seconds(), 1)
+        if self._duration is None or self._duration[0] is not self.completed_at:
+            elapsed = round((self.completed_at - self.started_at).total_seconds(), 1)
+            self._duration = (self.completed_at, elapsed)
+        return self._duration[1]
+
+    def history_json(self, serialize: Callable[["ScrapeJob"], bytes]) -> bytes:
+        """Serialized history entry, built once with ``serialize`` and reused.
+
+        Only valid for archived jobs, which are terminal and never mutated.
+
+        Args:
+            serialize: Encodes the job as a JSON response entry
+
+        Returns:
+            Cached JSON bytes for this job
+        """
+        if self._history_json is None:
+            self._history_json = serialize(self)
+        return self._history_json
+
+
+def _token_hash(token: str) -> str:
+    """Fingerprint a bot token so the raw value isn't kept for comparisons."""
+    return hashlib.sha256(token.encode()).hexdigest()
+
 
 class ScrapeJobManager:
     """Manages background scrape jobs.
@@ -66,7 +150,15 @@ class ScrapeJobManager:
         self._task: asyncio.Task[None] | None = None
         self._bot: ArchiverBot | None = None
         self._cancel_requested = False
-        self._history: list[ScrapeJob] = []
+        self._history: deque[ScrapeJob] = deque(maxlen=MAX_HISTORY)
+        # Connected bot parked between jobs, and the task that closes it on expiry
+        self._warm_bot: ArchiverBot | None = None
+        self._warm_token_hash: str | None = None
+        self._warm_expiry: asyncio.Task[None] | None = None
+        # Bumped after every scrape that reached the scraping phase (whatever
+        # its outcome, batches are already committed) so read-side caches can
+        # key on it
+        self.data_version = 0
 
     @property
     def current_job(self) -> ScrapeJob | None:
@@ -111,8 +203,11 @@ class ScrapeJobManager:
         self._current_job = job
         self._cancel_requested = False
 
-        # Launch the background task
+        # Launch the background task. The job is archived from a done-callback
+        # so it reaches history even if cancelled before its first step; it is
+        # terminal by then, so the same object is shared with current_job.
         self._task = asyncio.create_task(self._run_scrape(job, token))
+        self._task.add_done_callback(lambda _: self._history.append(job))
         return job
 
     def cancel(self) -> bool:
@@ -128,20 +223,73 @@ class ScrapeJobManager:
         self._current_job.status = JobStatus.CANCELLED
         self._current_job.completed_at = datetime.now(UTC)
 
-        # Force-close the bot if running
-        if self._bot is not None:
-            asyncio.create_task(self._force_close_bot())
+        # Interrupt the scrape at its next await rather than waiting for a
+        # checkpoint; _run_scrape's cleanup closes the bot.
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
 
         return True
 
-    async def _force_close_bot(self) -> None:
-        """Force close the bot connection."""
-        if self._bot is not None:
+    async def shutdown(self) -> None:
+        """Cancel any running job and close the parked bot connection."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+        await self._close_warm_bot()
+
+    async def _take_warm_bot(self, token: str) -> ArchiverBot | None:
+        """Claim the parked bot if it is still connected with the same token.
+
+        Args:
+            token: Discord bot token for the new job
+
+        Returns:
+            The connected bot, or None if a fresh connection is needed
+        """
+        bot = self._warm_bot
+        if bot is None:
+            return None
+        if self._warm_token_hash != _token_hash(token) or bot.client.is_closed():
+            await self._close_warm_bot()
+            return None
+
+        if self._warm_expiry is not None:
+            self._warm_expiry.cancel()
+            self._warm_expiry = None
+        self._warm_bot = None
+        self._warm_token_hash = None
+        return bot
+
+    def _park_bot(self, bot: ArchiverBot, token: str) -> None:
+        """Keep a connected bot around for WARM_BOT_TTL seconds.
+
+        Args:
+            bot: Connected bot from a finished job
+            token: Token the bot logged in with
+        """
+        self._warm_bot = bot
+        self._warm_token_hash = _token_hash(token)
+        self._warm_expiry = asyncio.create_task(self._expire_warm_bot())
+
+    async def _expire_warm_bot(self) -> None:
+        """Close the parked bot once its TTL runs out."""
+        await asyncio.sleep(WARM_BOT_TTL)
+        self._warm_expiry = None
+        await self._close_warm_bot()
+
+    async def _close_warm_bot(self) -> None:
+        """Close and forget the parked bot, if any."""
+        if self._warm_expiry is not None:
+            self._warm_expiry.cancel()
+            self._warm_expiry = None
+        bot, self._warm_bot = self._warm_bot, None
+        self._warm_token_hash = None
+        if bot is not None:
             try:
-                await self._bot.close()
+                await bot.close()
             except Exception:
                 pass
-            self._bot = None
 
     async def _run_scrape(self, job: ScrapeJob, token: str) -> None:
         """Execute the scrape job in the background.
@@ -150,15 +298,20 @@ class ScrapeJobManager:
             job: The job to execute
             token: Discord bot token
         """
+        scraping_started = False
         try:
             # Phase 1: Connect to Discord
             job.status = JobStatus.CONNECTING
             logger.info("Scrape job %s: connecting to Discord...", job.id)
 
-            bot = ArchiverBot(token, self.database)
-            self._bot = bot
-
-            await bot.start()
+            bot = await self._take_warm_bot(token)
+            if bot is not None:
+                logger.info("Scrape job %s: reusing open Discord connection", job.id)
+                self._bot = bot
+            else:
+                bot = ArchiverBot(token, self.database)
+                self._bot = bot
+                await bot.start()
 
             if self._cancel_requested:
                 await bot.close()
@@ -167,23 +320,42 @@ class ScrapeJobManager:
 
             # Phase 2: Run the scrape
             job.status = JobStatus.SCRAPING
+            scraping_started = True
             logger.info("Scrape job %s: scraping guild %d...", job.id, job.guild_id)
 
+            # Latest values from the scraper; copied into job.progress at most
+            # every PROGRESS_MIN_INTERVAL so the hot loop stays cheap.
+            last_channel = ""
+            last_emit = 0.0
+
             def progress_callback(channel_name: str, message_count: int) -> None:
                 """Update job progress from scraper callback."""
-                job.progress.current_channel = channel_name
-                job.progress.messages_scraped = message_count
+                nonlocal last_channel, last_emit
+                last_channel = channel_name
+                now = time.monotonic()
+                if now - last_emit >= PROGRESS_MIN_INTERVAL:
+                    last_emit = now
+                    job.progress.current_channel = channel_name
+                    job.progress.messages_scraped = message_count
 
             stats = await bot.scrape_guild(job.guild_id, progress_callback)
 
-            # Phase 3: Record results
-            job.status = JobStatus.COMPLETED
+            # Phase 3: Record results, swapping in the final progress in one
+            # assignment (this also flushes anything the throttle held back)
+            errors = cast(list[str], stats.get("errors", []))
+            job.progress = ScrapeProgress(
+                current_channel=last_channel,
+                channels_done=int(stats.get("channels_scraped", 0)),
+                messages_scraped=int(stats.get("messages_scraped", 0)),
+                attachments_found=int(stats.get("attachments_found", 0)),
+                errors=errors[:MAX_PROGRESS_ERRORS],
+                errors_truncated=max(0, len(errors) - MAX_PROGRESS_ERRORS),
+            )
+            # result carries the same capped error list as progress, so status
+            # and history responses stay bounded however many channels failed
+            job.result = {**stats, "errors": job.progress.errors}
             job.completed_at = datetime.now(UTC)
-            job.result = stats
-            job.progress.channels_done = int(stats.get("channels_scraped", 0))
-            job.progress.messages_scraped = int(stats.get("messages_scraped", 0))
-            job.progress.attachments_found = int(stats.get("attachments_found", 0))
-            job.progress.errors = [str(e) for e in stats.get("errors", [])]
+            job.status = JobStatus.COMPLETED
 
             logger.info(
                 "Scrape job %s: completed — %d channels, %d messages",
@@ -196,6 +368,7 @@ class ScrapeJobManager:
             job.status = JobStatus.CANCELLED
             job.completed_at = datetime.now(UTC)
             logger.info("Scrape job %s: cancelled", job.id)
+            raise
 
         except Exception as e:
             job.status = JobStatus.FAILED
@@ -204,17 +377,16 @@ class ScrapeJobManager:
             logger.error("Scrape job %s: failed — %s", job.id, e)
 
         finally:
-            # Always clean up the bot
+            if scraping_started:
+                self.data_version += 1
+            # Keep the connection warm after a successful job; close it on
+            # failure or cancellation since its state is suspect.
             if self._bot is not None:
-                try:
-                    await self._bot.close()
-                except Exception:
-                    pass
+                if job.status == JobStatus.COMPLETED:
+                    self._park_bot(self._bot, token)
+                else:
+                    try:
+                        await self._bot.close()
+                    except Exception:
+                        pass
                 self._bot = None
-
-            # Archive to history
-            if self._current_job is not None:
-                self._history.append(self._current_job.model_copy())
-                # Keep only last 50 jobs
-                if len(self._history) > 50:
-                    self._history = self._history[-50:]
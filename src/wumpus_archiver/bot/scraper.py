@@ -1,20 +1,17 @@
 """Discord bot scraper implementation."""
 
 import asyncio
-import json
+import logging
 from collections.abc import Callable
 from datetime import UTC, datetime
+from typing import Any
 
 import discord
+import orjson
 from discord.ext import commands
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from wumpus_archiver.models.attachment import Attachment
-from wumpus_archiver.models.channel import Channel
 from wumpus_archiver.models.guild import Guild
-from wumpus_archiver.models.message import Message
-from wumpus_archiver.models.reaction import Reaction
-from wumpus_archiver.models.user import User
 from wumpus_archiver.storage.database import Database
 from wumpus_archiver.storage.repositories import (
     AttachmentRepository,
@@ -25,6 +22,29 @@ from wumpus_archiver.storage.repositories import (
     UserRepository,
 )
 
+logger = logging.getLogger(__name__)
+
+
+# Messages buffered per channel before a bulk write + commit
+BATCH_SIZE = 1000
+
+# Messages between progress callbacks; decoupled from BATCH_SIZE so progress
+# stays fine-grained while commits stay large
+PROGRESS_INTERVAL = 100
+
+# Authors remembered as already written during one guild scrape; the set is
+# reset past this size to keep memory bounded on huge servers
+SEEN_USERS_MAX = 100_000
+
+# Fetched messages allowed to wait for the writer in each channel
+HISTORY_QUEUE_SIZE = 500
+
+# Channels scraped concurrently within a guild
+CHANNEL_CONCURRENCY = 16
+
+# Text channels whose archived-thread listings are fetched at once
+ARCHIVED_THREAD_CONCURRENCY = 32
+
 
 class ArchiverBot:
     """Discord bot for archiving server data."""
@@ -40,6 +60,8 @@ class ArchiverBot:
         self.database = database
         self._ready_event = asyncio.Event()
         self._bot_task: asyncio.Task[None] | None = None
+        # IDs of users upserted (and committed) during the current guild scrape
+        self._seen_users: set[int] = set()
 
         # Setup Discord intents
         intents = discord.Intents.default()
@@ -58,7 +80,7 @@ class ArchiverBot:
     async def on_ready(self) -> None:
         """Called when bot is ready."""
         if self.client.user:
-            print(f"Logged in as {self.client.user} (ID: {self.client.user.id})")
+            logger.info("Logged in as %s (ID: %d)", self.client.user, self.client.user.id)
         self._ready_event.set()
 
     async def scrape_guild(
@@ -90,75 +112,83 @@ class ArchiverBot:
         messages_scraped = 0
         attachments_found = 0
         errors: list[str] = []
+        self._seen_users.clear()
 
         async with self.database.session() as session:
-            # Save guild info
+            # Save guild info (committed before channels reference it)
             await self._save_guild(session, guild)
+            # Every channel's archived high-water mark in one query
+            last_message_ids = await ChannelRepository(session).get_last_message_ids(guild_id)
+
+        # Collect all scrapeable channels: text, voice, and stage channels
+        scrapeable_channels: list[
+            discord.TextChannel | discord.VoiceChannel | discord.StageChannel
+        ] = []
+        scrapeable_channels.extend(guild.text_channels)
+        scrapeable_channels.extend(guild.voice_channels)
+        scrapeable_channels.extend(guild.stage_channels)
+
+        # Also include forum channels if available
+        for forum in getattr(guild, "forum_channels", []):
+            scrapeable_channels.append(forum)
+
+        # Collect archived threads (public), listing channels concurrently
+        archived_threads: list[discord.Thread] = []
+        listing_semaphore = asyncio.Semaphore(ARCHIVED_THREAD_CONCURRENCY)
+        listings = await asyncio.gather(
+            *(
+                self._list_archived_threads(text_channel, listing_semaphore)
+                for text_channel in guild.text_channels
+            ),
+            return_exceptions=True,
+        )
+        forbidden = False
+        for listing in listings:
+            if isinstance(listing, discord.Forbidden):
+                forbidden = True
+            elif isinstance(listing, BaseException):
+                raise listing
+            else:
+                archived_threads.extend(listing)
+        if forbidden:
+            errors.append("No permission to list archived threads")
+
+        # History fetching is I/O-bound, so scrape channels concurrently up to
+        # CHANNEL_CONCURRENCY at a time, each with its own session.
+        semaphore = asyncio.Semaphore(CHANNEL_CONCURRENCY)
+        targets = [
+            *((channel, "channel") for channel in scrapeable_channels),
+            *((thread, "thread") for thread in guild.threads),
+            *((thread, "archived thread") for thread in archived_threads),
+        ]
+        results = await asyncio.gather(
+            *(
+                self._scrape_channel_guarded(
+                    channel,
+                    kind,
+                    semaphore,
+                    errors,
+                    progress_callback,
+                    prev_last_id=last_message_ids.get(channel.id),
+                )
+                for channel, kind in targets
+            )
+        )
 
-            # Collect all scrapeable channels: text, voice, and stage channels
-            scrapeable_channels: list[
-                discord.TextChannel | discord.VoiceChannel | discord.StageChannel
-            ] = []
-            scrapeable_channels.extend(guild.text_channels)
-            scrapeable_channels.extend(guild.voice_channels)
-            scrapeable_channels.extend(guild.stage_channels)
-
-            # Also include forum channels if available
-            for forum in getattr(guild, "forum_channels", []):
-                scrapeable_channels.append(forum)
-
-            # Scrape each channel
-            for channel in scrapeable_channels:
-                try:
-                    channel_stats = await self._scrape_channel(
-                        session, channel, progress_callback
-                    )
-                    channels_scraped += 1
-                    messages_scraped += channel_stats["messages"]
-                    attachments_found += channel_stats["attachments"]
-                except discord.Forbidden:
-                    error_msg = f"No permission to scrape #{channel.name}"
-                    errors.append(error_msg)
-                    print(error_msg)
-                except Exception as e:
-                    error_msg = f"Error scraping channel {channel.name}: {e}"
-                    errors.append(error_msg)
-                    print(error_msg)
-
-            # Scrape active threads
-            for thread in guild.threads:
-                try:
-                    channel_stats = await self._scrape_channel(session, thread, progress_callback)
-                    channels_scraped += 1
-                    messages_scraped += channel_stats["messages"]
-                    attachments_found += channel_stats["attachments"]
-                except Exception as e:
-                    error_msg = f"Error scraping thread {thread.name}: {e}"
-                    errors.append(error_msg)
-                    print(error_msg)
-
-            # Scrape archived threads (public)
-            try:
-                for text_channel in guild.text_channels:
-                    async for thread in text_channel.archived_threads(limit=None):
-                        try:
-                            channel_stats = await self._scrape_channel(
-                                session, thread, progress_callback
-                            )
-                            channels_scraped += 1
-                            messages_scraped += channel_stats["messages"]
-                            attachments_found += channel_stats["attachments"]
-                        except Exception as e:
-                            error_msg = f"Error scraping archived thread {thread.name}: {e}"
-                            errors.append(error_msg)
-                            print(error_msg)
-            except discord.Forbidden:
-                errors.append("No permission to list archived threads")
+        for channel_stats in results:
+            if channel_stats is not None:
+                channels_scraped += 1
+                messages_scraped += channel_stats["messages"]
+                attachments_found += channel_stats["attachments"]
 
+        async with self.database.session() as session:
             # Update guild scrape metadata
             guild_repo = GuildRepository(session)
             await guild_repo.update_scrape_metadata(guild_id)
 
+        # Row counts shift a lot during a scrape; keep planner stats current
+        await self.database.analyze()
+
         stats["channels_scraped"] = channels_scraped
         stats["messages_scraped"] = messages_scraped
         stats["attachments_found"] = attachments_found
@@ -166,6 +196,60 @@ class ArchiverBot:
 
         return stats
 
+    async def _list_archived_threads(
+        self,
+        channel: discord.TextChannel,
+        semaphore: asyncio.Semaphore,
+    ) -> list[discord.Thread]:
+        """List a text channel's public archived threads.
+
+        Args:
+            channel: Discord text channel
+            semaphore: Bounds how many listings run at once
+
+        Returns:
+            Archived threads of the channel
+        """
+        async with semaphore:
+            return [thread async for thread in channel.archived_threads(limit=None)]
+
+    async def _scrape_channel_guarded(
+        self,
+        channel: discord.TextChannel | discord.VoiceChannel | discord.Thread | discord.StageChannel,
+        kind: str,
+        semaphore: asyncio.Semaphore,
+        errors: list[str],
+        progress_callback: Callable[[str, int], None] | None = None,
+        prev_last_id: int | None = None,
+    ) -> dict[str, int] | None:
+        """Scrape one channel in its own session, recording failures.
+
+        Args:
+            channel: Discord channel or thread
+            kind: Label used in error messages ("channel", "thread", ...)
+            semaphore: Bounds how many channels are scraped at once
+            errors: Error messages list to append failures to
+            progress_callback: Optional progress callback
+            prev_last_id: Last message ID archived by a previous scrape
+
+        Returns:
+            Channel stats, or None if the channel failed
+        """
+        async with semaphore:
+            try:
+                async with self.database.session() as session:
+                    return await self._scrape_channel(
+                        session, channel, progress_callback, prev_last_id
+                    )
+            except Exception as e:
+                if isinstance(e, discord.Forbidden) and kind == "channel":
+                    error_msg = f"No permission to scrape #{channel.name}"
+                else:
+                    error_msg = f"Error scraping {kind} {channel.name}: {e}"
+        errors.append(error_msg)
+        logger.warning(error_msg)
+        return None
+
     async def _save_guild(self, session: AsyncSession, guild: discord.Guild) -> Guild:
         """Save guild data to database."""
         guild_repo = GuildRepository(session)
@@ -185,13 +269,18 @@ class ArchiverBot:
         session: AsyncSession,
         channel: discord.TextChannel | discord.VoiceChannel | discord.Thread | discord.StageChannel,
         progress_callback: Callable[[str, int], None] | None = None,
+        prev_last_id: int | None = None,
     ) -> dict[str, int]:
         """Scrape all messages from a channel or thread.
 
+        History is only read back to ``prev_last_id``, so re-scrapes cost
+        O(new messages).
+
         Args:
             session: Database session
             channel: Discord channel, thread, or forum channel
             progress_callback: Optional progress callback
+            prev_last_id: Last message ID archived by a previous scrape, if any
 
         Returns:
             Dict with channel scraping stats
@@ -205,27 +294,91 @@ class ArchiverBot:
         parent_id = getattr(channel, "parent_id", None) or getattr(channel, "category_id", None)
 
         # Save channel info
-        db_channel = Channel(
-            id=channel.id,
-            guild_id=guild_id,
-            name=channel.name,
-            type=channel.type.value,
-            topic=topic,
-            position=position,
-            parent_id=parent_id,
+        await channel_repo.upsert_many(
+            [
+                {
+                    "id": channel.id,
+                    "guild_id": guild_id,
+                    "name": channel.name,
+                    "type": channel.type.value,
+                    "topic": topic,
+                    "position": position,
+                    "parent_id": parent_id,
+                }
+            ]
         )
-        await channel_repo.upsert(db_channel)
-
         stats = {"messages": 0, "attachments": 0}
+        # Idle channel: Discord's cached last_message_id is no newer than the
+        # archive's, so skip the history request entirely and only record
+        # that the channel was checked
+        remote_last_id = getattr(channel, "last_message_id", None)
+        if (
+            prev_last_id is not None
+            and remote_last_id is not None
+            and remote_last_id <= prev_last_id
+        ):
+            await channel_repo.mark_scraped(channel.id)
+            await session.commit()
+            return stats
+
+        # Commit now so the write transaction isn't held open while history
+        # pages download (other channels write concurrently)
+        await session.commit()
+
+        # One timestamp per channel pass; per-message precision isn't needed
+        scraped_at = datetime.now(UTC)
         first_message_id: int | None = None
         last_message_id: int | None = None
-        batch_size = 100
 
-        # Fetch messages with pagination (newest first)
-        async for message in channel.history(limit=None, oldest_first=False):
+        # Rows buffered as plain dicts and written in bulk every BATCH_SIZE
+        # messages; users are keyed by ID so each appears once per batch.
+        users: dict[int, dict[str, Any]] = {}
+        messages: list[dict[str, Any]] = []
+        attachments: list[dict[str, Any]] = []
+        reactions: list[dict[str, Any]] = []
+
+        # Discord fetches and DB writes overlap: the producer keeps paging
+        # history while the consumer flushes. The bounded queue caps how far
+        # the producer can run ahead.
+        queue: asyncio.Queue[discord.Message | None] = asyncio.Queue(maxsize=HISTORY_QUEUE_SIZE)
+
+        async def produce() -> None:
+            # Fetch messages with pagination (newest first), stopping at the
+            # previous high-water mark
+            after = discord.Object(id=prev_last_id) if prev_last_id is not None else None
+            history = channel.history(limit=None, after=after, oldest_first=False)
             try:
-                await self._save_message(session, message)
+                async for message in history:
+                    await queue.put(message)
+            finally:
+                # Release the paginator's buffered page promptly, including
+                # when the consumer fails and this task is cancelled
+                await history.aclose()  # type: ignore[attr-defined]
+            await queue.put(None)
+
+        async def consume() -> None:
+            nonlocal first_message_id, last_message_id
+            while (message := await queue.get()) is not None:
+                try:
+                    message_row = self._message_row(message, scraped_at)
+                    author = message.author
+                    if author and author.id not in self._seen_users:
+                        users[author.id] = self._user_row(author)
+                    attachments.extend(
+                        self._attachment_row(attachment, message.id)
+                        for attachment in message.attachments
+                    )
+                    reactions.extend(
+                        self._reaction_row(reaction, message.id) for reaction in message.reactions
+                    )
+                except Exception as e:
+                    logger.warning("Error saving message %d: %s", message.id, e)
+                    continue
+
+                messages.append(message_row)
                 stats["messages"] += 1
+                if progress_callback and stats["messages"] % PROGRESS_INTERVAL == 0:
+                    progress_callback(channel.name, stats["messages"])
 
                 # Track first/last message IDs (oldest_first=False → first seen is newest)
                 if last_message_id is None:
@@ -235,150 +388,154 @@ class ArchiverBot:
                 if message.attachments:
                     stats["attachments"] += len(message.attachments)
 
-                # Commit in batches to avoid long-running transactions
-                if stats["messages"] % batch_size == 0:
-                    await session.commit()
-
-                    if progress_callback:
-                        progress_callback(
-                            channel.name,
-                            stats["messages"],
-                        )
+                # Write and commit in batches to avoid long-running transactions
+                if len(messages) >= BATCH_SIZE:
+                    await self._flush_batch(session, users, messages, attachments, reactions)
 
-            except Exception as e:
-                print(f"Error saving message {message.id}: {e}")
-
-        # Final commit for remaining messages
-        await session.commit()
-
-        # Update channel metadata using tracked IDs (avoids redundant API calls)
-        if stats["messages"] > 0:
-            if first_message_id is not None:
-                db_channel.first_message_id = first_message_id
-            if last_message_id is not None:
-                db_channel.last_message_id = last_message_id
+            # Update channel metadata using tracked IDs (avoids redundant API
+            # calls); it commits together with the final batch. first_message_id
+            # is only the channel's oldest on a full scrape.
+            if stats["messages"] > 0 and last_message_id is not None:
                 await channel_repo.update_message_metadata(
-                    channel.id, last_message_id, stats["messages"]
+                    channel.id,
+                    last_message_id,
+                    stats["messages"],
+                    first_message_id if prev_last_id is None else None,
                 )
+            else:
+                await channel_repo.mark_scraped(channel.id)
+
+            # Final flush for remaining messages
+            await self._flush_batch(session, users, messages, attachments, reactions)
+            # Report the channel's final count; the interval above misses the tail
+            if progress_callback and stats["messages"]:
+                progress_callback(channel.name, stats["messages"])
+
+        # A failure on either side cancels the other; surface the original
+        # error rather than the wrapping ExceptionGroup.
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(produce())
+                tg.create_task(consume())
+        except ExceptionGroup as eg:
+            raise eg.exceptions[0] from None
 
         return stats
 
-    async def _save_message(
+    async def _flush_batch(
         self,
         session: AsyncSession,
-        message: discord.Message,
-    ) -> Message:
-        """Save a message and its related data."""
-        # Save author first
-        if message.author:
-            await self._save_user(session, message.author)
-
-        # Create message
-        db_message = Message(
-            id=message.id,
-            channel_id=message.channel.id,
-            author_id=message.author.id if message.author else None,
-            content=message.content or "",
-            clean_content=message.clean_content or "",
-            created_at=message.created_at.astimezone(UTC).replace(tzinfo=None),
-            edited_at=(
-                message.edited_at.astimezone(UTC).replace(tzinfo=None)
-                if message.edited_at
-                else None
-            ),
-            pinned=message.pinned,
-            tts=message.tts,
-            mention_everyone=message.mention_everyone,
-            embeds=(
-                json.dumps([embed.to_dict() for embed in message.embeds])
+        users: dict[int, dict[str, Any]],
+        messages: list[dict[str, Any]],
+        attachments: list[dict[str, Any]],
+        reactions: list[dict[str, Any]],
+    ) -> None:
+        """Bulk-write buffered rows, commit, and clear the buffers.
+
+        Args:
+            session: Database session
+            users: Author rows keyed by user ID
+            messages: Message rows
+            attachments: Attachment rows
+            reactions: Reaction rows for the buffered messages
+        """
+        if messages:
+            # Parents first so foreign keys resolve on backends that enforce them.
+            # Concurrent channels share authors, so upsert them in ID order to
+            # take row locks in the same order everywhere (no deadlocks).
+            await UserRepository(session).upsert_many(sorted(users.values(), key=lambda u: u["id"]))
+            await MessageRepository(session).upsert_many(messages)
+            await AttachmentRepository(session).upsert_many(attachments)
+            await ReactionRepository(session).replace_for_messages(
+                [row["id"] for row in messages], reactions
+            )
+        await session.commit()
+
+        if len(self._seen_users) > SEEN_USERS_MAX:
+            self._seen_users.clear()
+        self._seen_users.update(users)
+        users.clear()
+        messages.clear()
+        attachments.clear()
+        reactions.clear()
+
+    def _message_row(self, message: discord.Message, scraped_at: datetime) -> dict[str, Any]:
+        """Build a ``messages`` row from a Discord message."""
+        content = message.content or ""
+        # clean_content only rewrites <@id>/<@&id>/<#id> mentions and escapes
+        # @everyone/@here/@id; without "<" or "@" it is the content itself, so
+        # skip its regex pass for the common case
+        has_mentions = "<" in content or "@" in content
+        clean_content = (message.clean_content or "") if has_mentions else content
+        return {
+            "id": message.id,
+            "channel_id": message.channel.id,
+            "author_id": message.author.id if message.author else None,
+            "content": content,
+            "clean_content": clean_content,
+            # Aware datetimes; the UTCNaive column type normalizes them on bind
+            "created_at": message.created_at,
+            "edited_at": message.edited_at,
+            "pinned": message.pinned,
+            "tts": message.tts,
+            "mention_everyone": message.mention_everyone,
+            "embeds": (
+                orjson.dumps([embed.to_dict() for embed in message.embeds]).decode()
                 if message.embeds
                 else None
             ),
-            reference_id=message.reference.message_id if message.reference else None,
-            scraped_at=datetime.now(UTC),
-        )
-
-        message_repo = MessageRepository(session)
-        db_message = await message_repo.upsert(db_message)
-
-        # Save attachments
-        for attachment in message.attachments:
-            await self._save_attachment(session, attachment, message.id)
-
-        # Save reactions
-        for reaction in message.reactions:
-            await self._save_reaction(session, reaction, message.id)
-
-        return db_message
-
-    async def _save_user(
-        self,
-        session: AsyncSession,
-        user: discord.User | discord.Member,
-    ) -> User:
-        """Save user data."""
-        user_repo = UserRepository(session)
-
-        avatar_url = str(user.avatar.url) if user.avatar else None
-
-        db_user = User(
-            id=user.id,
-            username=user.name,
-            discriminator=user.discriminator if hasattr(user, "discriminator") else None,
-            global_name=user.global_name if hasattr(user, "global_name") else None,
-            avatar_url=avatar_url,
-            bot=user.bot,
-        )
-
-        return await user_repo.upsert(db_user)
-
-    async def _save_attachment(
-        self,
-        session: AsyncSession,
-        attachment: discord.Attachment,
-        message_id: int,
-    ) -> Attachment:
-        """Save attachment data."""
-        attachment_repo = AttachmentRepository(session)
-
-        db_attachment = Attachment(
-            id=attachment.id,
-            message_id=message_id,
-            filename=attachment.filename,
-            content_type=attachment.content_type,
-            size=attachment.size,
-            url=attachment.url,
-            proxy_url=attachment.proxy_url,
-            width=attachment.width,
-            height=attachment.height,
-            download_status="pending",
-        )
+            "reference_id": message.reference.message_id if message.reference else None,
+            "scraped_at": scraped_at,
+            "updated_at": None,
+        }
 
-        return await attachment_repo.upsert(db_attachment)
+    def _user_row(self, user: discord.User | discord.Member) -> dict[str, Any]:
+        """Build a ``users`` row from a Discord user."""
+        return {
+            "id": user.id,
+            "username": user.name,
+            "discriminator": getattr(user, "discriminator", None),
+            "global_name": getattr(user, "global_name", None),
+            "avatar_url": str(user.avatar.url) if user.avatar else None,
+            "bot": user.bot,
+        }
 
-    async def _save_reaction(
-        self,
-        session: AsyncSession,
-        reaction: discord.Reaction,
-        message_id: int,
-    ) -> Reaction:
-        """Save reaction data."""
-        reaction_repo = ReactionRepository(session)
-
-        emoji_name = reaction.emoji.name if hasattr(reaction.emoji, "name") else str(reaction.emoji)
-        emoji_id = reaction.emoji.id if hasattr(reaction.emoji, "id") else None
-
-        db_reaction = Reaction(
-            message_id=message_id,
-            emoji_name=emoji_name,
-            emoji_id=emoji_id,
-            emoji_animated=(
-                reaction.emoji.animated if hasattr(reaction.emoji, "animated") else False
-            ),
-            count=reaction.count,
-        )
+    def _attachment_row(self, attachment: discord.Attachment, message_id: int) -> dict[str, Any]:
+        """Build an ``attachments`` row from a Discord attachment."""
+        return {
+            "id": attachment.id,
+            "message_id": message_id,
+            "filename": attachment.filename,
+            "content_type": attachment.content_type,
+            "size": attachment.size,
+            "url": attachment.url,
+            "proxy_url": attachment.proxy_url,
+            "width": attachment.width,
+            "height": attachment.height,
+            "local_path": None,
+            "download_status": "pending",
+            "content_hash": None,
+        }
 
-        return await reaction_repo.upsert(db_reaction)
+    def _reaction_row(self, reaction: discord.Reaction, message_id: int) -> dict[str, Any]:
+        """Build a ``reactions`` row from a Discord reaction."""
+        emoji = reaction.emoji
+        # Unicode reactions arrive as plain strings; custom ones as (Partial)Emoji
+        if isinstance(emoji, str):
+            return {
+                "message_id": message_id,
+                "emoji_name": emoji,
+                "emoji_id": None,
+                "emoji_animated": False,
+                "count": reaction.count,
+            }
+        return {
+            "message_id": message_id,
+            "emoji_name": emoji.name,
+            "emoji_id": emoji.id,
+            "emoji_animated": emoji.animated,
+            "count": reaction.count,
+        }
 
     async def start(self) -> None:
         """Start the bot and wait until it's ready."""
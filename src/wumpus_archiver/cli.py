@@ -1,9 +1,14 @@
 """Command-line interface for wumpus-archiver."""
 
 import asyncio
+import logging
+import logging.handlers
+import queue
 import sys
+from collections.abc import Callable, Coroutine, Iterator
+from contextlib import contextmanager
 from pathlib import Path
-from typing import cast
+from typing import Any, cast
 
 from importlib.metadata import version as pkg_version
 
@@ -14,6 +19,65 @@ from wumpus_archiver.config import Settings
 from wumpus_archiver.storage.database import Database
 
 
+def _loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Return uvloop's loop constructor when the ``speedups`` extra is installed.
+
+    Returns:
+        ``uvloop.new_event_loop`` if available, otherwise None (stdlib loop).
+    """
+    if sys.platform == "win32":
+        return None
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return cast(Callable[[], asyncio.AbstractEventLoop], uvloop.new_event_loop)
+
+
+def _run_async[T](main: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion, on uvloop when available.
+
+    Args:
+        main: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    with asyncio.Runner(loop_factory=_loop_factory()) as runner:
+        return runner.run(main)
+
+
+@contextmanager
+def _queued_logging(level: int) -> Iterator[None]:
+    """Route log records through a queue drained on a background thread.
+
+    Formatting and stream writes then happen off the event loop, so warnings
+    logged from scraper tasks never block it. Only this package's loggers get
+    ``level``; discord.py and the database drivers stay at WARNING.
+
+    Args:
+        level: Level for the ``wumpus_archiver`` loggers
+    """
+    records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+    queue_handler = logging.handlers.QueueHandler(records)
+    root = logging.getLogger()
+    root.addHandler(queue_handler)
+    package_logger = logging.getLogger("wumpus_archiver")
+    previous_level = package_logger.level
+    package_logger.setLevel(level)
+    listener = logging.handlers.QueueListener(records, stream_handler)
+    listener.start()
+    try:
+        yield
+    finally:
+        root.removeHandler(queue_handler)
+        package_logger.setLevel(previous_level)
+        # Flushes records still queued before returning
+        listener.stop()
+
+
 @click.group()
 @click.version_option(version=pkg_version("wumpus-archiver"))
 def cli() -> None:
@@ -117,15 +181,16 @@ def scrape(
             await bot.close()
             await database.disconnect()
 
-    try:
-        exit_code = asyncio.run(run_scraper())
-        sys.exit(exit_code)
-    except KeyboardInterrupt:
-        click.echo("\nScraping interrupted by user.")
-        sys.exit(130)
-    except Exception as e:
-        click.echo(f"Error: {e}", err=True)
-        sys.exit(1)
+    with _queued_logging(logging.DEBUG if verbose else logging.INFO):
+        try:
+            exit_code = _run_async(run_scraper())
+            sys.exit(exit_code)
+        except KeyboardInterrupt:
+            click.echo("\nScraping interrupted by user.")
+            sys.exit(130)
+        except Exception as e:
+            click.echo(f"Error: {e}", err=True)
+            sys.exit(1)
 
 
 @cli.command()
@@ -277,8 +342,6 @@ def download(
     verbose: bool,
 ) -> None:
     """Download all image attachments from the archive to local storage."""
-    import logging
-
     from wumpus_archiver.utils.downloader import ImageDownloader
 
     if verbose:
@@ -348,7 +411,7 @@ def download(
             await db.disconnect()
 
     try:
-        exit_code = asyncio.run(run_download())
+        exit_code = _run_async(run_download())
         sys.exit(exit_code)
     except KeyboardInterrupt:
         click.echo("\nDownload interrupted by user.")
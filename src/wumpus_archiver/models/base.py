@@ -1,9 +1,34 @@
 """Base model with common functionality."""
 
+from datetime import UTC, datetime
+from typing import Any, ClassVar
+
+from sqlalchemy import DateTime, Table
+from sqlalchemy.engine import Dialect
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.types import TypeDecorator
 
 
 class Base(DeclarativeBase):
     """Base class for all models."""
 
-    pass
+    # Every model is declared with __tablename__, so its mapped selectable is
+    # a Table (DeclarativeBase only promises a FromClause)
+    __table__: ClassVar[Table]
+
+
+class UTCNaive(TypeDecorator[datetime]):
+    """``DateTime`` column that stores UTC without tzinfo.
+
+    Aware datetimes (as Discord returns them) are converted to UTC and
+    stripped on bind, so callers don't need to normalize every value.
+    """
+
+    impl = DateTime
+    cache_ok = True
+
+    def process_bind_param(self, value: datetime | None, dialect: Dialect) -> Any:
+        """Normalize aware datetimes to naive UTC."""
+        if value is None or value.tzinfo is None:
+            return value
+        return value.astimezone(UTC).replace(tzinfo=None)
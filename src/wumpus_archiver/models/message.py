@@ -3,10 +3,10 @@
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import BigInteger, DateTime, ForeignKey, Index, Text
+from sqlalchemy import BigInteger, ForeignKey, Index, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from wumpus_archiver.models.base import Base
+from wumpus_archiver.models.base import Base, UTCNaive
 
 if TYPE_CHECKING:
     from wumpus_archiver.models.attachment import Attachment
@@ -29,8 +29,8 @@ class Message(Base):
     clean_content: Mapped[str] = mapped_column(Text, default="", nullable=False)
 
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
-    edited_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(UTCNaive, nullable=False)
+    edited_at: Mapped[datetime | None] = mapped_column(UTCNaive, nullable=True)
 
     # Message metadata
     pinned: Mapped[bool] = mapped_column(default=False, nullable=False)
@@ -44,8 +44,8 @@ class Message(Base):
     reference_id: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
 
     # Archival metadata
-    scraped_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
-    updated_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    scraped_at: Mapped[datetime] = mapped_column(UTCNaive, nullable=False)
+    updated_at: Mapped[datetime | None] = mapped_column(UTCNaive, nullable=True)
 
     # Relationships
     channel: Mapped["Channel"] = relationship("Channel", back_populates="messages")
@@ -60,7 +60,12 @@ class Message(Base):
     # Indexes for common queries
     __table_args__ = (
         Index("ix_messages_channel_id_created_at", "channel_id", "created_at"),
-        Index("ix_messages_author_id", "author_id"),
+        # Covers per-author stats (count/min/max over created_at) scoped by channel
+        Index(
+            "ix_messages_author_id_channel_id_created_at", "author_id", "channel_id", "created_at"
+        ),
+        # Guild user listing: channel scope first, then group by author
+        Index("ix_messages_channel_id_author_id", "channel_id", "author_id"),
         Index("ix_messages_created_at", "created_at"),
     )
 
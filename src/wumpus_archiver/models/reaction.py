@@ -31,7 +31,7 @@ class Reaction(Base):
     message: Mapped["Message"] = relationship("Message", back_populates="reactions")
 
     # Indexes
-    __table_args__ = (Index("ix_reactions_message_id", "message_id"),)
+    __table_args__ = (Index("ix_reactions_message_id_count", "message_id", "count"),)
 
     def __repr__(self) -> str:
         emoji = self.emoji_name or f":{self.emoji_id}:"
@@ -2,16 +2,107 @@
 
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from typing import Any
 
+from sqlalchemy import Connection, event, inspect, make_url, text
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from wumpus_archiver.models.base import Base
 
+# Indexes older archives may still carry that a composite model index now
+# covers as its leading column; keeping them only slows down writes.
+SUPERSEDED_INDEXES = {
+    "messages": ("ix_messages_author_id",),
+    "reactions": ("ix_reactions_message_id",),
+}
+
+
+def _create_missing_indexes(conn: Connection) -> int:
+    """Create model indexes absent from already-existing tables.
+
+    ``create_all`` skips tables that exist, so indexes added to the models
+    later would otherwise never reach older archives. Indexes listed in
+    ``SUPERSEDED_INDEXES`` are dropped along the way.
+
+    Returns:
+        Number of indexes created or dropped
+    """
+    inspector = inspect(conn)
+    changed = 0
+    for table in Base.metadata.sorted_tables:
+        existing = {ix["name"] for ix in inspector.get_indexes(table.name)}
+        for name in SUPERSEDED_INDEXES.get(table.name, ()):
+            if name in existing:
+                conn.execute(text(f"DROP INDEX {name}"))
+                changed += 1
+        for index in table.indexes:
+            if index.name not in existing:
+                index.create(conn)
+                changed += 1
+    return changed
+
+
+# Applied to every new SQLite connection. Concurrent channel scrapes each
+# write through their own connection, so writers wait up to busy_timeout for
+# the write lock instead of failing with "database is locked". The archive is
+# read with heavy aggregate queries, so keep pages memory-mapped and
+# sort/group temps in RAM; WAL lets API readers run alongside an active
+# scrape, and under WAL synchronous=NORMAL only fsyncs at checkpoints while
+# staying corruption-safe.
+SQLITE_PRAGMAS = (
+    "PRAGMA busy_timeout=30000",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+)
+
+
+def _apply_sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+    """Connect-event hook that tunes a fresh SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+def _engine_options(database_url: str) -> dict[str, Any]:
+    """Build pool settings for the given database URL.
+
+    Profile queries, API requests and concurrent channel scrapes (one
+    session each) all hold connections at once, so file and server databases
+    get an explicitly async-adapted pool wide enough to avoid queueing.
+    Server connections are recycled before common proxy idle cutoffs.
+    In-memory SQLite uses a single static connection and is left alone.
+
+    Args:
+        database_url: SQLAlchemy async database URL
+
+    Returns:
+        Keyword arguments for ``create_async_engine``
+    """
+    url = make_url(database_url)
+    if url.get_backend_name() == "sqlite":
+        if url.database in (None, "", ":memory:"):
+            return {}
+        return {"poolclass": AsyncAdaptedQueuePool, "pool_size": 20, "max_overflow": 10}
+    return {
+        "poolclass": AsyncAdaptedQueuePool,
+        "pool_size": 20,
+        "max_overflow": 10,
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,
+    }
+
 
 class Database:
     """Database manager for async SQLAlchemy operations."""
@@ -32,7 +123,10 @@ class Database:
             self.database_url,
             echo=False,
             future=True,
+            **_engine_options(self.database_url),
         )
+        if self._engine.dialect.name == "sqlite":
+            event.listen(self._engine.sync_engine, "connect", _apply_sqlite_pragmas)
         self._session_maker = async_sessionmaker(
             self._engine,
             expire_on_commit=False,
@@ -53,6 +147,17 @@ class Database:
 
         async with self._engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
+            if await conn.run_sync(_create_missing_indexes):
+                # Refresh planner statistics so the new indexes get picked up
+                await conn.execute(text("ANALYZE"))
+
+    async def analyze(self) -> None:
+        """Refresh query planner statistics after bulk writes."""
+        if not self._engine:
+            raise RuntimeError("Database not connected. Call connect() first.")
+
+        async with self._engine.begin() as conn:
+            await conn.execute(text("ANALYZE"))
 
     @asynccontextmanager
     async def session(self) -> AsyncGenerator[AsyncSession, None]:
@@ -1,9 +1,24 @@
 """Repository pattern implementations."""
 
+from collections.abc import Sequence
 from datetime import UTC, datetime
-
-from sqlalchemy import desc, select
+from typing import Any
+
+from sqlalchemy import (
+    TableClause,
+    bindparam,
+    column,
+    delete,
+    desc,
+    insert,
+    select,
+    table,
+    text,
+    update,
+)
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.dml import Insert
 
 from wumpus_archiver.models.attachment import Attachment
 from wumpus_archiver.models.channel import Channel
@@ -12,6 +27,160 @@ from wumpus_archiver.models.message import Message
 from wumpus_archiver.models.reaction import Reaction
 from wumpus_archiver.models.user import User
 
+# Dialects with INSERT ... ON CONFLICT DO UPDATE. Other backends upsert by
+# looking up which IDs exist, then updating those rows and inserting the rest.
+ON_CONFLICT_DIALECTS = ("postgresql", "sqlite")
+
+
+def _upsert_statement(
+    session: AsyncSession,
+    table: TableClause,
+    index_elements: Sequence[str],
+    update_columns: Sequence[str],
+    **extra_set: Any,
+) -> Insert:
+    """Build a dialect-specific ``INSERT ... ON CONFLICT DO UPDATE`` statement.
+
+    Args:
+        session: Session whose bind decides the dialect
+        table: Target table
+        index_elements: Conflict target columns
+        update_columns: Columns overwritten from the incoming row on conflict
+        **extra_set: Additional column values applied only on conflict
+
+    Returns:
+        Statement to execute with a list of row dicts
+    """
+    dialect = session.get_bind().dialect.name
+    stmt: postgresql.Insert | sqlite.Insert
+    if dialect == "postgresql":
+        stmt = postgresql.insert(table)
+    elif dialect == "sqlite":
+        stmt = sqlite.insert(table)
+    else:
+        raise ValueError(f"Bulk upsert not supported for dialect {dialect!r}")
+
+    set_ = {col: stmt.excluded[col] for col in update_columns}
+    set_.update(extra_set)
+    return stmt.on_conflict_do_update(index_elements=list(index_elements), set_=set_)
+
+
+async def _copy_records(
+    session: AsyncSession, target: TableClause, rows: list[dict[str, Any]], table_name: str = ""
+) -> None:
+    """Stream rows into a PostgreSQL table with asyncpg's binary COPY.
+
+    Runs on the session's own connection, so it joins the open transaction.
+    COPY bypasses SQLAlchemy's parameter handling, so column bind processors
+    (e.g. ``UTCNaive``) are applied here.
+
+    Args:
+        session: Session bound to an asyncpg engine
+        target: Table whose column types describe the rows
+        rows: Column dicts, all with the same keys
+        table_name: Destination table, if different from ``target`` (staging)
+    """
+    columns = list(rows[0])
+    conn = await session.connection()
+    dialect = conn.dialect
+    processors = [target.c[c].type.bind_processor(dialect) for c in columns]
+    records = [
+        tuple(
+            proc(row[c]) if proc is not None else row[c]
+            for c, proc in zip(columns, processors, strict=True)
+        )
+        for row in rows
+    ]
+    raw = await conn.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(  # type: ignore[union-attr]
+        table_name or target.name,
+        records=records,
+        columns=columns,
+    )
+
+
+async def _bulk_upsert(
+    session: AsyncSession,
+    target: TableClause,
+    rows: list[dict[str, Any]],
+    update_columns: Sequence[str],
+    *,
+    use_copy: bool = False,
+    **extra_set: Any,
+) -> None:
+    """Upsert rows keyed on ``id``.
+
+    With ``use_copy`` on PostgreSQL, rows are COPYed into a transaction-scoped
+    staging table and merged with one ``INSERT ... SELECT ... ON CONFLICT``;
+    otherwise they go through a single executemany upsert. Dialects outside
+    ``ON_CONFLICT_DIALECTS`` fall back to ``_select_then_upsert``.
+
+    Args:
+        session: Database session
+        target: Target table
+        rows: Column dicts, all with the same keys and unique IDs
+        update_columns: Columns overwritten from the incoming row on conflict
+        use_copy: Prefer the COPY path when the dialect supports it
+        **extra_set: Additional column values applied only on conflict
+    """
+    if not rows:
+        return
+    dialect = session.get_bind().dialect.name
+    if dialect not in ON_CONFLICT_DIALECTS:
+        await _select_then_upsert(session, target, rows, update_columns, **extra_set)
+        return
+    stmt = _upsert_statement(session, target, ["id"], update_columns, **extra_set)
+
+    if use_copy and dialect == "postgresql":
+        stage = f"_stage_{target.name}"
+        columns = list(rows[0])
+        await session.execute(text(f"DROP TABLE IF EXISTS {stage}"))
+        await session.execute(
+            text(f"CREATE TEMP TABLE {stage} (LIKE {target.name}) ON COMMIT DROP")
+        )
+        await _copy_records(session, target, rows, stage)
+        staged = table(stage, *(column(c) for c in columns))
+        await session.execute(stmt.from_select(columns, select(staged), include_defaults=False))
+    else:
+        await session.execute(stmt, rows)
+
+
+async def _select_then_upsert(
+    session: AsyncSession,
+    target: TableClause,
+    rows: list[dict[str, Any]],
+    update_columns: Sequence[str],
+    **extra_set: Any,
+) -> None:
+    """Upsert rows keyed on ``id`` without ``ON CONFLICT`` support.
+
+    One SELECT finds the IDs already stored; those rows get an executemany
+    UPDATE of ``update_columns`` (plus ``extra_set``) and the rest one
+    executemany INSERT.
+
+    Args:
+        session: Database session
+        target: Target table
+        rows: Column dicts, all with the same keys and unique IDs
+        update_columns: Columns overwritten from the incoming row when it exists
+        **extra_set: Additional column values applied only to existing rows
+    """
+    result = await session.execute(
+        select(target.c.id).where(target.c.id.in_([row["id"] for row in rows]))
+    )
+    existing = set(result.scalars())
+    updates = [
+        {"b_id": row["id"], **{c: row[c] for c in update_columns}, **extra_set}
+        for row in rows
+        if row["id"] in existing
+    ]
+    inserts = [row for row in rows if row["id"] not in existing]
+    if updates:
+        # No values(): the SET clause comes from the parameter keys
+        await session.execute(update(target).where(target.c.id == bindparam("b_id")), updates)
+    if inserts:
+        await session.execute(insert(target), inserts)
+
 
 class GuildRepository:
     """Repository for Guild operations."""
@@ -74,6 +243,17 @@ class ChannelRepository:
         result = await self.session.execute(select(Channel).where(Channel.guild_id == guild_id))
         return list(result.scalars().all())
 
+    async def get_last_message_ids(self, guild_id: int) -> dict[int, int | None]:
+        """Get the newest archived message ID of every channel in a guild.
+
+        Returns:
+            Mapping of channel ID to last archived message ID (None if empty)
+        """
+        result = await self.session.execute(
+            select(Channel.id, Channel.last_message_id).where(Channel.guild_id == guild_id)
+        )
+        return dict(result.all())
+
     async def upsert(self, channel: Channel) -> Channel:
         """Insert or update channel."""
         existing = await self.get_by_id(channel.id)
@@ -87,15 +267,46 @@ class ChannelRepository:
             self.session.add(channel)
             return channel
 
+    async def upsert_many(self, rows: list[dict[str, Any]]) -> None:
+        """Insert or update channels without loading them into the session.
+
+        Args:
+            rows: Column dicts for ``channels``; IDs must be unique within the list
+        """
+        await _bulk_upsert(
+            self.session,
+            Channel.__table__,
+            rows,
+            ["name", "topic", "position", "parent_id"],
+        )
+
     async def update_message_metadata(
-        self, channel_id: int, last_message_id: int, increment: int = 1
+        self,
+        channel_id: int,
+        last_message_id: int,
+        increment: int = 1,
+        first_message_id: int | None = None,
     ) -> None:
-        """Update channel message count and last message."""
-        channel = await self.get_by_id(channel_id)
-        if channel:
-            channel.last_message_id = last_message_id
-            channel.message_count += increment
-            channel.last_scraped_at = datetime.now(UTC)
+        """Update channel message count and first/last message in one statement.
+
+        The count is incremented in SQL, so no prior SELECT is needed.
+        """
+        values: dict[str, Any] = {
+            "last_message_id": last_message_id,
+            "message_count": Channel.message_count + increment,
+            "last_scraped_at": datetime.now(UTC),
+        }
+        if first_message_id is not None:
+            values["first_message_id"] = first_message_id
+        await self.session.execute(update(Channel).where(Channel.id == channel_id).values(**values))
+
+    async def mark_scraped(self, channel_id: int) -> None:
+        """Stamp ``last_scraped_at`` on a channel that had nothing new to archive."""
+        await self.session.execute(
+            update(Channel)
+            .where(Channel.id == channel_id)
+            .values(last_scraped_at=datetime.now(UTC))
+        )
 
 
 class MessageRepository:
@@ -148,6 +359,21 @@ class MessageRepository:
             self.session.add(message)
             return message
 
+    async def upsert_many(self, rows: list[dict[str, Any]]) -> None:
+        """Insert or update many messages in one executemany round-trip.
+
+        Args:
+            rows: Column dicts for ``messages``, one per message, all with the same keys
+        """
+        await _bulk_upsert(
+            self.session,
+            Message.__table__,
+            rows,
+            ["content", "clean_content", "edited_at", "embeds", "pinned"],
+            use_copy=True,
+            updated_at=datetime.now(UTC),
+        )
+
     async def bulk_upsert(self, messages: list[Message]) -> list[Message]:
         """Insert or update multiple messages efficiently."""
         result = []
@@ -182,6 +408,19 @@ class UserRepository:
             self.session.add(user)
             return user
 
+    async def upsert_many(self, rows: list[dict[str, Any]]) -> None:
+        """Insert or update many users in one executemany round-trip.
+
+        Args:
+            rows: Column dicts for ``users``; IDs must be unique within the list
+        """
+        await _bulk_upsert(
+            self.session,
+            User.__table__,
+            rows,
+            ["username", "discriminator", "global_name", "avatar_url", "bot"],
+        )
+
 
 class AttachmentRepository:
     """Repository for Attachment operations."""
@@ -205,6 +444,23 @@ class AttachmentRepository:
             self.session.add(attachment)
             return attachment
 
+    async def upsert_many(self, rows: list[dict[str, Any]]) -> None:
+        """Insert or refresh many attachments in one executemany round-trip.
+
+        Existing rows get fresh Discord metadata (URLs expire) but keep their
+        download state, so a re-scrape never discards already-fetched files.
+
+        Args:
+            rows: Column dicts for ``attachments``; IDs must be unique within the list
+        """
+        await _bulk_upsert(
+            self.session,
+            Attachment.__table__,
+            rows,
+            ["filename", "content_type", "size", "url", "proxy_url", "width", "height"],
+            use_copy=True,
+        )
+
 
 class ReactionRepository:
     """Repository for Reaction operations."""
@@ -229,3 +485,27 @@ class ReactionRepository:
         else:
             self.session.add(reaction)
             return reaction
+
+    async def replace_for_messages(
+        self, message_ids: Sequence[int], rows: list[dict[str, Any]]
+    ) -> None:
+        """Replace all reactions on the given messages with a fresh snapshot.
+
+        Reactions have no natural unique key to upsert on, so the batch's
+        existing rows are deleted and the new ones inserted in bulk. This also
+        drops reactions that were removed on Discord since the last scrape.
+
+        Args:
+            message_ids: Messages whose reactions are being replaced
+            rows: Column dicts for ``reactions`` (without ``id``)
+        """
+        if not message_ids:
+            return
+        await self.session.execute(delete(Reaction).where(Reaction.message_id.in_(message_ids)))
+        if not rows:
+            return
+        if self.session.get_bind().dialect.name == "postgresql":
+            # Nothing left to conflict with, so COPY straight into the table
+            await _copy_records(self.session, Reaction.__table__, rows)
+        else:
+            await self.session.execute(insert(Reaction.__table__), rows)
@@ -34,6 +34,10 @@ DEFAULT_MAX_RETRIES = 3
 DEFAULT_RETRY_DELAY = 2.0
 DEFAULT_TIMEOUT = 60
 
+# Idle CDN connections are kept this long (seconds) for reuse across channels
+KEEPALIVE_TIMEOUT = 60
+DNS_CACHE_TTL = 300
+
 
 def _sanitize_filename(filename: str) -> str:
     """Sanitize a filename for safe filesystem storage.
@@ -128,6 +132,22 @@ class ImageDownloader:
         self.stats = DownloadStats()
         self._semaphore = asyncio.Semaphore(concurrency)
 
+    def _http_session(self) -> aiohttp.ClientSession:
+        """Create the HTTP session shared by every channel of a download run.
+
+        One keep-alive connection pool per run means TCP/TLS handshakes to
+        the Discord CDN are paid once per connection, not once per channel.
+
+        Returns:
+            New aiohttp client session (use as async context manager)
+        """
+        connector = aiohttp.TCPConnector(
+            limit_per_host=self.concurrency,
+            keepalive_timeout=KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=DNS_CACHE_TTL,
+        )
+        return aiohttp.ClientSession(connector=connector, timeout=self.timeout)
+
     async def download_guild_images(
         self,
         guild_id: int,
@@ -156,12 +176,14 @@ class ImageDownloader:
 
         logger.info("Found %d channels in guild %d", len(channels), guild_id)
 
-        for channel in channels:
-            await self._download_channel_images(
-                channel_id=channel.id,
-                channel_name=channel.name,
-                progress_callback=progress_callback,
-            )
+        async with self._http_session() as http_session:
+            for channel in channels:
+                await self._download_channel_images(
+                    http_session,
+                    channel_id=channel.id,
+                    channel_name=channel.name,
+                    progress_callback=progress_callback,
+                )
 
         return self.stats
 
@@ -188,17 +210,20 @@ class ImageDownloader:
 
         logger.info("Found %d channels total", len(channels))
 
-        for channel in channels:
-            await self._download_channel_images(
-                channel_id=channel.id,
-                channel_name=channel.name,
-                progress_callback=progress_callback,
-            )
+        async with self._http_session() as http_session:
+            for channel in channels:
+                await self._download_channel_images(
+                    http_session,
+                    channel_id=channel.id,
+                    channel_name=channel.name,
+                    progress_callback=progress_callback,
+                )
 
         return self.stats
 
     async def _download_channel_images(
         self,
+        http_session: aiohttp.ClientSession,
         channel_id: int,
         channel_name: str,
         progress_callback: "((str, int, int) -> None) | None" = None,
@@ -206,6 +231,7 @@ class ImageDownloader:
         """Download all image attachments for a single channel.
 
         Args:
+            http_session: aiohttp client session shared across channels
             channel_id: Channel ID to download images from
             channel_name: Human-readable channel name for logging
             progress_callback: Optional callback(channel_name, done, total)
@@ -239,67 +265,66 @@ class ImageDownloader:
         offset = 0
         channel_done = 0
 
-        async with aiohttp.ClientSession(timeout=self.timeout) as http_session:
-            while offset < total:
-                async with self.database.session() as session:
-                    result = await session.execute(
-                        select(Attachment)
-                        .where(
-                            Attachment.message_id.in_(
-                                select(Message.id).where(
-                                    Message.channel_id == channel_id
-                                )
+        while offset < total:
+            async with self.database.session() as session:
+                result = await session.execute(
+                    select(Attachment)
+                    .where(
+                        Attachment.message_id.in_(
+                            select(Message.id).where(
+                                Message.channel_id == channel_id
                             )
                         )
-                        .where(Attachment.content_type.in_(IMAGE_CONTENT_TYPES))
-                        .order_by(Attachment.id)
-                        .offset(offset)
-                        .limit(batch_size)
                     )
-                    attachments = list(result.scalars().all())
-
-                if not attachments:
-                    break
-
-                # Download batch concurrently
-                tasks = [
-                    self._download_attachment(http_session, att, channel_dir)
-                    for att in attachments
-                ]
-                results = await asyncio.gather(*tasks, return_exceptions=True)
-
-                # Process results and update DB
-                async with self.database.session() as session:
-                    for att, download_result in zip(attachments, results):
-                        if isinstance(download_result, Exception):
-                            logger.error(
-                                "Unexpected error for %s: %s",
-                                att.filename,
-                                download_result,
-                            )
-                            self.stats.failed += 1
-                            self.stats.errors.append(
-                                f"{att.filename}: {download_result}"
-                            )
-                            await self._update_attachment_status(
-                                session, att.id, "failed", None, None
-                            )
-                        elif download_result is not None:
-                            local_path, content_hash, size = download_result
-                            await self._update_attachment_status(
-                                session, att.id, "downloaded", local_path, content_hash
-                            )
-                            self.stats.downloaded += 1
-                            self.stats.total_bytes += size
-                        # None means skipped (already downloaded)
+                    .where(Attachment.content_type.in_(IMAGE_CONTENT_TYPES))
+                    .order_by(Attachment.id)
+                    .offset(offset)
+                    .limit(batch_size)
+                )
+                attachments = list(result.scalars().all())
+
+            if not attachments:
+                break
+
+            # Download batch concurrently
+            tasks = [
+                self._download_attachment(http_session, att, channel_dir)
+                for att in attachments
+            ]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+
+            # Process results and update DB
+            async with self.database.session() as session:
+                for att, download_result in zip(attachments, results):
+                    if isinstance(download_result, Exception):
+                        logger.error(
+                            "Unexpected error for %s: %s",
+                            att.filename,
+                            download_result,
+                        )
+                        self.stats.failed += 1
+                        self.stats.errors.append(
+                            f"{att.filename}: {download_result}"
+                        )
+                        await self._update_attachment_status(
+                            session, att.id, "failed", None, None
+                        )
+                    elif download_result is not None:
+                        local_path, content_hash, size = download_result
+                        await self._update_attachment_status(
+                            session, att.id, "downloaded", local_path, content_hash
+                        )
+                        self.stats.downloaded += 1
+                        self.stats.total_bytes += size
+                    # None means skipped (already downloaded)
 
-                    await session.commit()
+                await session.commit()
 
-                channel_done += len(attachments)
-                if progress_callback:
-                    progress_callback(channel_name, channel_done, total)
+            channel_done += len(attachments)
+            if progress_callback:
+                progress_callback(channel_name, channel_done, total)
 
-                offset += batch_size
+            offset += batch_size
 
     async def _download_attachment(
         self,
@@ -1,11 +1,13 @@
 """Tests for CLI commands."""
 
+import logging
 from importlib.metadata import version as pkg_version
 from pathlib import Path
 
+import pytest
 from click.testing import CliRunner
 
-from wumpus_archiver.cli import cli
+from wumpus_archiver.cli import _queued_logging, cli
 
 
 class TestCLI:
@@ -108,3 +110,21 @@ class TestCLI:
             result2 = runner.invoke(cli, ["init"])
             assert result1.exit_code == 0
             assert result2.exit_code == 0
+
+
+class TestQueuedLogging:
+    """Tests for the scrape command's queued logging setup."""
+
+    def test_scopes_level_and_removes_handler(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test that only package loggers are verbose and the setup is undone."""
+        root_handlers = list(logging.getLogger().handlers)
+
+        with _queued_logging(logging.DEBUG):
+            logging.getLogger("wumpus_archiver.bot.scraper").debug("package debug")
+            logging.getLogger("discord.gateway").debug("library debug")
+
+        assert logging.getLogger().handlers == root_handlers
+        assert logging.getLogger("wumpus_archiver").level == logging.NOTSET
+        err = capsys.readouterr().err
+        assert "package debug" in err
+        assert "library debug" not in err
@@ -2,7 +2,7 @@
 
 import pytest
 
-from wumpus_archiver.storage.database import Database
+from wumpus_archiver.storage.database import Database, _engine_options
 
 
 class TestDatabase:
@@ -40,6 +40,96 @@ class TestDatabase:
 
         await db.disconnect()
 
+    async def test_create_tables_adds_missing_indexes(self, tmp_path) -> None:
+        """Test that create_tables backfills indexes on existing tables."""
+        from sqlalchemy import inspect as sa_inspect
+        from sqlalchemy import text
+
+        db = Database(f"sqlite+aiosqlite:///{tmp_path / 'indexes.db'}")
+        await db.connect()
+        await db.create_tables()
+
+        async with db.engine.begin() as conn:
+            await conn.execute(text("DROP INDEX ix_reactions_message_id_count"))
+
+        await db.create_tables()
+
+        async with db.engine.connect() as conn:
+
+            def index_names(sync_conn):  # type: ignore[no-untyped-def]
+                return {ix["name"] for ix in sa_inspect(sync_conn).get_indexes("reactions")}
+
+            names = await conn.run_sync(index_names)
+
+        assert "ix_reactions_message_id_count" in names
+
+        await db.disconnect()
+
+    async def test_create_tables_drops_superseded_indexes(self, tmp_path) -> None:
+        """Test that create_tables removes indexes replaced by composite ones."""
+        from sqlalchemy import inspect as sa_inspect
+        from sqlalchemy import text
+
+        db = Database(f"sqlite+aiosqlite:///{tmp_path / 'superseded.db'}")
+        await db.connect()
+        await db.create_tables()
+
+        async with db.engine.begin() as conn:
+            await conn.execute(text("CREATE INDEX ix_messages_author_id ON messages (author_id)"))
+            await conn.execute(
+                text("CREATE INDEX ix_reactions_message_id ON reactions (message_id)")
+            )
+
+        await db.create_tables()
+
+        async with db.engine.connect() as conn:
+
+            def index_names(sync_conn):  # type: ignore[no-untyped-def]
+                inspector = sa_inspect(sync_conn)
+                return {
+                    ix["name"]
+                    for table in ("messages", "reactions")
+                    for ix in inspector.get_indexes(table)
+                }
+
+            names = await conn.run_sync(index_names)
+
+        assert "ix_messages_author_id" not in names
+        assert "ix_reactions_message_id" not in names
+        assert "ix_messages_author_id_channel_id_created_at" in names
+        assert "ix_reactions_message_id_count" in names
+
+        await db.disconnect()
+
+    async def test_sqlite_pragmas_applied_on_connect(self, tmp_path) -> None:
+        """Test that new SQLite connections get the tuning pragmas."""
+        from sqlalchemy import text
+
+        db = Database(f"sqlite+aiosqlite:///{tmp_path / 'pragmas.db'}")
+        await db.connect()
+
+        async with db.engine.connect() as conn:
+            journal_mode = (await conn.execute(text("PRAGMA journal_mode"))).scalar()
+            temp_store = (await conn.execute(text("PRAGMA temp_store"))).scalar()
+            synchronous = (await conn.execute(text("PRAGMA synchronous"))).scalar()
+            busy_timeout = (await conn.execute(text("PRAGMA busy_timeout"))).scalar()
+
+        assert journal_mode == "wal"
+        assert temp_store == 2  # MEMORY
+        assert synchronous == 1  # NORMAL
+        assert busy_timeout == 30000
+
+        await db.disconnect()
+
+    def test_engine_options_by_backend(self) -> None:
+        """Test pool settings chosen for each kind of database URL."""
+        assert _engine_options("sqlite+aiosqlite:///:memory:") == {}
+        assert _engine_options("sqlite+aiosqlite:///archive.db")["pool_size"] == 20
+
+        pg = _engine_options("postgresql+asyncpg://u:p@localhost/archive")
+        assert pg["pool_pre_ping"] is True
+        assert pg["pool_recycle"] == 1800
+
     async def test_create_tables_without_connect_raises(self) -> None:
         """Test that create_tables raises if not connected."""
         db = Database("sqlite+aiosqlite:///unused.db")
@@ -1,7 +1,12 @@
 """Tests for repository classes."""
 
 from datetime import UTC, datetime
+from types import SimpleNamespace
+from typing import Any
 
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from wumpus_archiver.models.attachment import Attachment
@@ -10,6 +15,7 @@ from wumpus_archiver.models.guild import Guild
 from wumpus_archiver.models.message import Message
 from wumpus_archiver.models.reaction import Reaction
 from wumpus_archiver.models.user import User
+from wumpus_archiver.storage import repositories
 from wumpus_archiver.storage.repositories import (
     AttachmentRepository,
     ChannelRepository,
@@ -19,6 +25,111 @@ from wumpus_archiver.storage.repositories import (
     UserRepository,
 )
 
+# Column values shared by every bulk-write row a test builds; tests override
+# the fields they care about
+_ROW_DEFAULTS: dict[str, dict[str, object]] = {
+    "channels": {"type": 0, "topic": None, "position": 0, "parent_id": None},
+    "users": {"discriminator": None, "global_name": None, "avatar_url": None, "bot": False},
+    "messages": {
+        "author_id": None,
+        "created_at": datetime(2024, 1, 1, tzinfo=UTC),
+        "edited_at": None,
+        "pinned": False,
+        "tts": False,
+        "mention_everyone": False,
+        "embeds": None,
+        "reference_id": None,
+        "scraped_at": datetime(2024, 1, 1, tzinfo=UTC),
+        "updated_at": None,
+    },
+    "attachments": {
+        "content_type": None,
+        "proxy_url": None,
+        "width": None,
+        "height": None,
+        "local_path": None,
+        "download_status": "pending",
+        "content_hash": None,
+    },
+    "reactions": {"emoji_id": None, "emoji_animated": False},
+}
+
+
+def _row(table: str, **values: object) -> dict[str, object]:
+    """Build a bulk-write row for ``table``, as the scraper does."""
+    return {**_ROW_DEFAULTS[table], **values}
+
+
+class FakePostgresSession:
+    """Session stand-in that records SQL and COPYs instead of running them.
+
+    It doubles as the session's connection and asyncpg's driver connection.
+    """
+
+    def __init__(self) -> None:
+        self.dialect = postgresql.dialect()
+        self.statements: list[str] = []
+        self.copies: list[tuple[str, list[str], list[tuple[Any, ...]]]] = []
+
+    def get_bind(self) -> SimpleNamespace:
+        return SimpleNamespace(dialect=self.dialect)
+
+    async def execute(self, statement: Any, params: Any = None) -> None:
+        self.statements.append(" ".join(str(statement.compile(dialect=self.dialect)).split()))
+
+    async def connection(self) -> "FakePostgresSession":
+        return self
+
+    async def get_raw_connection(self) -> SimpleNamespace:
+        return SimpleNamespace(driver_connection=self)
+
+    async def copy_records_to_table(
+        self, table_name: str, *, records: list[tuple[Any, ...]], columns: list[str]
+    ) -> None:
+        self.copies.append((table_name, columns, records))
+
+
+class TestPostgresCopyPath:
+    """Tests for the PostgreSQL COPY write path, against a recording session."""
+
+    async def test_upsert_many_merges_through_staging_table(self) -> None:
+        """Test that bulk upserts COPY into a temp table and merge from it."""
+        session = FakePostgresSession()
+        row = _row(
+            "messages",
+            id=1,
+            channel_id=2,
+            content="hi",
+            clean_content="hi",
+            created_at=datetime(2024, 1, 1, 12, tzinfo=UTC),
+        )
+
+        await MessageRepository(session).upsert_many([row])  # type: ignore[arg-type]
+
+        drop, create, merge = session.statements
+        assert drop == "DROP TABLE IF EXISTS _stage_messages"
+        assert create == "CREATE TEMP TABLE _stage_messages (LIKE messages) ON COMMIT DROP"
+        assert merge.startswith("INSERT INTO messages (")
+        assert "FROM _stage_messages ON CONFLICT (id) DO UPDATE SET" in merge
+
+        [(table_name, columns, records)] = session.copies
+        assert table_name == "_stage_messages"
+        assert columns == list(row)
+        # COPY skips SQLAlchemy's binds, so UTCNaive is applied by hand
+        created_at = records[0][columns.index("created_at")]
+        assert created_at == datetime(2024, 1, 1, 12)
+
+    async def test_replace_for_messages_copies_into_table(self) -> None:
+        """Test that reaction snapshots COPY straight into the reactions table."""
+        session = FakePostgresSession()
+        rows = [_row("reactions", message_id=1, emoji_name="👍", count=2)]
+
+        await ReactionRepository(session).replace_for_messages([1], rows)  # type: ignore[arg-type]
+
+        [delete_sql] = session.statements
+        assert delete_sql.startswith("DELETE FROM reactions WHERE")
+        assert session.copies == [("reactions", list(rows[0]), [tuple(rows[0].values())])]
+
 
 class TestGuildRepository:
     """Tests for GuildRepository."""
@@ -161,6 +272,43 @@ class TestChannelRepository:
         assert result.message_count == 50
         assert result.last_scraped_at is not None
 
+    async def test_get_last_message_ids(self, session: AsyncSession) -> None:
+        """Test reading every channel's scrape high-water mark in a guild."""
+        guild = Guild(id=2350, name="High Water Test")
+        session.add(guild)
+        await session.flush()
+
+        repo = ChannelRepository(session)
+        await repo.upsert(Channel(id=2351, guild_id=2350, name="a", type=0))
+        await repo.upsert(Channel(id=2352, guild_id=2350, name="b", type=0))
+        await session.flush()
+
+        await repo.update_message_metadata(2351, last_message_id=777, increment=1)
+        await session.flush()
+
+        assert await repo.get_last_message_ids(2350) == {2351: 777, 2352: None}
+        assert await repo.get_last_message_ids(9999) == {}
+
+    async def test_upsert_many(self, session: AsyncSession) -> None:
+        """Test bulk channel upsert keeps archival metadata on update."""
+        guild = Guild(id=2400, name="Bulk Channel Test")
+        session.add(guild)
+        await session.flush()
+
+        repo = ChannelRepository(session)
+
+        await repo.upsert_many([_row("channels", id=2401, guild_id=2400, name="old-name")])
+        await repo.update_message_metadata(2401, last_message_id=500, increment=5)
+        await session.flush()
+        await repo.upsert_many(
+            [_row("channels", id=2401, guild_id=2400, name="new-name", position=3)]
+        )
+
+        result = await session.execute(
+            select(Channel.name, Channel.position, Channel.message_count).where(Channel.id == 2401)
+        )
+        assert result.one() == ("new-name", 3, 5)
+
 
 class TestUserRepository:
     """Tests for UserRepository."""
@@ -185,6 +333,20 @@ class TestUserRepository:
         assert result.username == "newname"
         assert result.global_name == "New Name"
 
+    async def test_upsert_many(self, session: AsyncSession) -> None:
+        """Test bulk insert then update of users."""
+        repo = UserRepository(session)
+
+        await repo.upsert_many(
+            [_row("users", id=3100, username="a"), _row("users", id=3101, username="b")]
+        )
+        await repo.upsert_many(
+            [_row("users", id=3101, username="b2"), _row("users", id=3102, username="c")]
+        )
+
+        result = await session.execute(select(User.id, User.username).order_by(User.id))
+        assert result.all() == [(3100, "a"), (3101, "b2"), (3102, "c")]
+
 
 class TestMessageRepository:
     """Tests for MessageRepository."""
@@ -312,6 +474,53 @@ class TestMessageRepository:
         results = await repo.bulk_upsert(messages)
         assert len(results) == 3
 
+    async def test_upsert_many(self, session: AsyncSession) -> None:
+        """Test bulk upsert updates editable fields of existing messages."""
+        channel_id = await self._setup_channel(session)
+        repo = MessageRepository(session)
+
+        fields = {"channel_id": channel_id, "clean_content": ""}
+        await repo.upsert_many(
+            [
+                _row("messages", id=5400, content="one", **fields),
+                _row("messages", id=5401, content="two", **fields),
+            ]
+        )
+        await repo.upsert_many([_row("messages", id=5401, content="two edited", **fields)])
+
+        result = await session.execute(
+            select(Message.id, Message.content, Message.updated_at).order_by(Message.id)
+        )
+        rows = result.all()
+        assert [(r.id, r.content) for r in rows] == [(5400, "one"), (5401, "two edited")]
+        assert rows[0].updated_at is None
+        assert rows[1].updated_at is not None
+
+    async def test_upsert_many_without_on_conflict(
+        self, session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the select-then-upsert fallback used by other dialects."""
+        monkeypatch.setattr(repositories, "ON_CONFLICT_DIALECTS", ())
+        channel_id = await self._setup_channel(session)
+        repo = MessageRepository(session)
+
+        fields = {"channel_id": channel_id, "clean_content": ""}
+        await repo.upsert_many([_row("messages", id=5500, content="one", **fields)])
+        await repo.upsert_many(
+            [
+                _row("messages", id=5500, content="one edited", **fields),
+                _row("messages", id=5501, content="two", **fields),
+            ]
+        )
+
+        result = await session.execute(
+            select(Message.id, Message.content, Message.updated_at).order_by(Message.id)
+        )
+        rows = result.all()
+        assert [(r.id, r.content) for r in rows] == [(5500, "one edited"), (5501, "two")]
+        assert rows[0].updated_at is not None
+        assert rows[1].updated_at is None
+
 
 class TestAttachmentRepository:
     """Tests for AttachmentRepository."""
@@ -385,6 +594,48 @@ class TestAttachmentRepository:
         assert result.download_status == "downloaded"
         assert result.local_path == "/attachments/photo.jpg"
 
+    async def test_upsert_many_keeps_download_state(self, session: AsyncSession) -> None:
+        """Test re-scraped attachments refresh URLs but keep download state."""
+        msg_id = await self._setup_message(session)
+        session.add(
+            Attachment(
+                id=7002,
+                message_id=msg_id,
+                filename="old.png",
+                size=10,
+                url="https://cdn.discord.com/old.png",
+                local_path="/attachments/old.png",
+                download_status="downloaded",
+            )
+        )
+        await session.flush()
+
+        repo = AttachmentRepository(session)
+        await repo.upsert_many(
+            [
+                _row(
+                    "attachments",
+                    id=7002,
+                    message_id=msg_id,
+                    filename="old.png",
+                    content_type="image/png",
+                    size=10,
+                    url="https://cdn.discord.com/new.png",
+                )
+            ]
+        )
+
+        result = await session.execute(
+            select(Attachment.url, Attachment.download_status, Attachment.local_path).where(
+                Attachment.id == 7002
+            )
+        )
+        assert result.one() == (
+            "https://cdn.discord.com/new.png",
+            "downloaded",
+            "/attachments/old.png",
+        )
+
 
 class TestReactionRepository:
     """Tests for ReactionRepository."""
@@ -438,3 +689,24 @@ class TestReactionRepository:
         updated = Reaction(message_id=msg_id, emoji_name="👍", count=10)
         result = await repo.upsert(updated)
         assert result.count == 10
+
+    async def test_replace_for_messages(self, session: AsyncSession) -> None:
+        """Test reaction snapshots replace previous rows for the same messages."""
+        msg_id = await self._setup_message(session)
+        repo = ReactionRepository(session)
+
+        await repo.replace_for_messages(
+            [msg_id],
+            [
+                _row("reactions", message_id=msg_id, emoji_name="👍", count=1),
+                _row("reactions", message_id=msg_id, emoji_name="🎉", count=2),
+            ],
+        )
+        await repo.replace_for_messages(
+            [msg_id], [_row("reactions", message_id=msg_id, emoji_name="👍", count=5)]
+        )
+
+        result = await session.execute(
+            select(Reaction.emoji_name, Reaction.count).where(Reaction.message_id == msg_id)
+        )
+        assert result.all() == [("👍", 5)]
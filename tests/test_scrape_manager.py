@@ -0,0 +1,178 @@
+"""Tests for the background scrape job manager."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from wumpus_archiver.api import scrape_manager
+from wumpus_archiver.api.scrape_manager import (
+    MAX_PROGRESS_ERRORS,
+    JobStatus,
+    ScrapeJobManager,
+)
+
+
+class FakeBot:
+    """Stand-in for ArchiverBot that records its connection lifecycle."""
+
+    instances: list["FakeBot"] = []
+    errors = 0
+    fail = False
+    # When set, scrape_guild waits on it so tests can act mid-scrape
+    release: asyncio.Event | None = None
+
+    def __init__(self, token: str, database: object) -> None:
+        self.token = token
+        self.starts = 0
+        self.closed = False
+        self.client = SimpleNamespace(is_closed=lambda: self.closed)
+        FakeBot.instances.append(self)
+
+    async def start(self) -> None:
+        self.starts += 1
+
+    async def close(self) -> None:
+        self.closed = True
+
+    async def scrape_guild(self, guild_id: int, progress_callback=None) -> dict[str, object]:
+        if FakeBot.release is not None:
+            await FakeBot.release.wait()
+        if FakeBot.fail:
+            raise RuntimeError("scrape failed")
+        return {
+            "guild_name": "Test Guild",
+            "channels_scraped": 1,
+            "messages_scraped": 10,
+            "attachments_found": 0,
+            "errors": [f"error {i}" for i in range(FakeBot.errors)],
+        }
+
+
+@pytest.fixture
+def manager(monkeypatch: pytest.MonkeyPatch) -> ScrapeJobManager:
+    """Create a manager whose jobs run against FakeBot."""
+    FakeBot.instances = []
+    FakeBot.errors = 0
+    FakeBot.fail = False
+    FakeBot.release = None
+    monkeypatch.setattr(scrape_manager, "ArchiverBot", FakeBot)
+    return ScrapeJobManager(database=None)  # type: ignore[arg-type]
+
+
+async def _run_job(manager: ScrapeJobManager, token: str = "token") -> None:
+    """Start a job and wait for it to finish."""
+    manager.start_scrape(guild_id=1, token=token)
+    assert manager._task is not None
+    await manager._task
+
+
+class TestScrapeJobManager:
+    """Tests for ScrapeJobManager."""
+
+    async def test_errors_capped_in_progress_and_result(self, manager: ScrapeJobManager) -> None:
+        """Test that a job's stored error lists are bounded."""
+        FakeBot.errors = MAX_PROGRESS_ERRORS + 50
+
+        await _run_job(manager)
+
+        job = manager.history[0]
+        assert job.status == JobStatus.COMPLETED
+        assert len(job.progress.errors) == MAX_PROGRESS_ERRORS
+        assert job.progress.errors_truncated == 50
+        assert job.result is not None
+        assert len(job.result["errors"]) == MAX_PROGRESS_ERRORS
+
+        await manager.shutdown()
+
+    async def test_cancel_before_start_is_archived(self, manager: ScrapeJobManager) -> None:
+        """Test that a job cancelled before its first step reaches history."""
+        job = manager.start_scrape(guild_id=1, token="token")
+        assert manager.cancel() is True
+
+        assert manager._task is not None
+        with pytest.raises(asyncio.CancelledError):
+            await manager._task
+
+        assert manager.history == [job]
+        assert job.status == JobStatus.CANCELLED
+        assert FakeBot.instances == []
+        # Nothing was written, so read-side caches stay valid
+        assert manager.data_version == 0
+
+    async def test_cancel_during_scrape_closes_bot(self, manager: ScrapeJobManager) -> None:
+        """Test that cancelling a running scrape closes its bot and re-raises."""
+        FakeBot.release = asyncio.Event()
+
+        job = manager.start_scrape(guild_id=1, token="token")
+        while job.status != JobStatus.SCRAPING:
+            await asyncio.sleep(0)
+        bot = FakeBot.instances[0]
+
+        manager.cancel()
+        assert manager._task is not None
+        with pytest.raises(asyncio.CancelledError):
+            await manager._task
+
+        assert bot.closed
+        assert manager.history[0].status == JobStatus.CANCELLED
+        # Batches committed before the cancel still invalidate caches
+        assert manager.data_version == 1
+
+    async def test_warm_bot_reused_within_ttl(self, manager: ScrapeJobManager) -> None:
+        """Test that a back-to-back job reuses the connected bot."""
+        await _run_job(manager)
+        await _run_job(manager)
+
+        assert len(FakeBot.instances) == 1
+        bot = FakeBot.instances[0]
+        assert bot.starts == 1
+        assert not bot.closed
+
+        await manager.shutdown()
+        assert bot.closed
+
+    async def test_warm_bot_not_reused_with_other_token(self, manager: ScrapeJobManager) -> None:
+        """Test that a job with a different token closes the parked bot."""
+        await _run_job(manager, token="first")
+        await _run_job(manager, token="second")
+
+        first, second = FakeBot.instances
+        assert first.closed
+        assert second.token == "second"
+        assert second.starts == 1
+
+        await manager.shutdown()
+
+    async def test_warm_bot_expires_after_ttl(
+        self, manager: ScrapeJobManager, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the parked bot is closed once its TTL runs out."""
+        monkeypatch.setattr(scrape_manager, "WARM_BOT_TTL", 0.01)
+        await _run_job(manager)
+        bot = FakeBot.instances[0]
+
+        await asyncio.sleep(0.05)
+
+        assert bot.closed
+        assert manager._warm_bot is None
+
+    async def test_failed_job_closes_bot(self, manager: ScrapeJobManager) -> None:
+        """Test that a failed job closes its bot instead of parking it."""
+        FakeBot.fail = True
+
+        await _run_job(manager)
+
+        assert FakeBot.instances[0].closed
+        assert manager._warm_bot is None
+        assert manager.history[0].status == JobStatus.FAILED
+        assert manager.data_version == 1
+
+    async def test_data_version_bumped_per_completed_job(self, manager: ScrapeJobManager) -> None:
+        """Test that every completed scrape bumps the data version."""
+        await _run_job(manager)
+        await _run_job(manager)
+
+        assert manager.data_version == 2
+
+        await manager.shutdown()
@@ -0,0 +1,220 @@
+"""Tests for the channel scraper's write path."""
+
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from wumpus_archiver.bot import scraper
+from wumpus_archiver.bot.scraper import ArchiverBot
+from wumpus_archiver.models.channel import Channel
+from wumpus_archiver.models.guild import Guild
+from wumpus_archiver.models.message import Message
+from wumpus_archiver.storage.database import Database
+
+GUILD_ID = 100
+CHANNEL_ID = 200
+
+
+class FakeChannel:
+    """Text channel whose history serves generated messages newest first."""
+
+    def __init__(self, message_count: int) -> None:
+        self.id = CHANNEL_ID
+        self.name = "general"
+        self.guild = SimpleNamespace(id=GUILD_ID)
+        self.type = SimpleNamespace(value=0)
+        self.topic = None
+        self.position = 0
+        self.category_id = None
+        self.message_ids: list[int] = []
+        # ``after`` argument of each history() call
+        self.history_calls: list[int | None] = []
+        # Author of each message ID; unlisted messages are by author 1
+        self.author_ids: dict[int, int] = {}
+        self.add_messages(message_count)
+
+    @property
+    def last_message_id(self) -> int | None:
+        return self.message_ids[-1] if self.message_ids else None
+
+    def add_messages(self, count: int) -> None:
+        start = len(self.message_ids) + 1
+        self.message_ids.extend(range(start, start + count))
+
+    def history(self, limit: int | None = None, after: Any = None, oldest_first: bool = False):
+        self.history_calls.append(after.id if after is not None else None)
+        ids = [mid for mid in reversed(self.message_ids) if after is None or mid > after.id]
+
+        async def pages() -> AsyncIterator[SimpleNamespace]:
+            for mid in ids:
+                yield _message(self, mid, author_id=self.author_ids.get(mid, 1))
+
+        return pages()
+
+
+def _message(
+    channel: FakeChannel, message_id: int, content: str = "hi", author_id: int = 1
+) -> SimpleNamespace:
+    """Build a Discord-like message with no extras."""
+    author = SimpleNamespace(
+        id=author_id, name="user", discriminator="0", global_name=None, avatar=None, bot=False
+    )
+    return SimpleNamespace(
+        id=message_id,
+        channel=channel,
+        author=author,
+        content=content,
+        clean_content=f"clean:{content}",
+        created_at=datetime(2024, 1, 1, tzinfo=UTC) + timedelta(minutes=message_id),
+        edited_at=None,
+        pinned=False,
+        tts=False,
+        mention_everyone=False,
+        embeds=[],
+        reference=None,
+        attachments=[],
+        reactions=[],
+    )
+
+
+@pytest.fixture
+async def bot(database: Database, session: AsyncSession) -> ArchiverBot:
+    """Create a bot (never connected) with its guild already saved."""
+    session.add(Guild(id=GUILD_ID, name="Guild"))
+    await session.commit()
+    return ArchiverBot("token", database)
+
+
+async def _channel_row(session: AsyncSession) -> Channel:
+    """Reload the channel row after the scraper's commits."""
+    session.expire_all()
+    channel = await session.get(Channel, CHANNEL_ID)
+    assert channel is not None
+    return channel
+
+
+class TestScrapeChannel:
+    """Tests for ArchiverBot._scrape_channel."""
+
+    async def test_messages_written_in_batches(
+        self, bot: ArchiverBot, session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that messages are flushed every BATCH_SIZE plus a final flush."""
+        monkeypatch.setattr(scraper, "BATCH_SIZE", 10)
+        flush = bot._flush_batch
+        flushed: list[int] = []
+
+        async def counting_flush(session, users, messages, attachments, reactions):  # type: ignore[no-untyped-def]
+            flushed.append(len(messages))
+            await flush(session, users, messages, attachments, reactions)
+
+        monkeypatch.setattr(bot, "_flush_batch", counting_flush)
+
+        stats = await bot._scrape_channel(session, FakeChannel(25))
+
+        assert stats == {"messages": 25, "attachments": 0}
+        assert flushed == [10, 10, 5]
+        count = await session.scalar(select(func.count()).select_from(Message))
+        assert count == 25
+
+    async def test_users_upserted_in_id_order(
+        self, bot: ArchiverBot, session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that authors are written in ID order, not first-seen order."""
+        channel = FakeChannel(3)
+        # History is served newest first, so authors are first seen as 3, 2, 1
+        channel.author_ids = {1: 1, 2: 2, 3: 3}
+        upsert_many = scraper.UserRepository.upsert_many
+        upserted: list[int] = []
+
+        async def recording_upsert(repo, rows):  # type: ignore[no-untyped-def]
+            upserted.extend(row["id"] for row in rows)
+            await upsert_many(repo, rows)
+
+        monkeypatch.setattr(scraper.UserRepository, "upsert_many", recording_upsert)
+
+        await bot._scrape_channel(session, channel)
+
+        assert upserted == [1, 2, 3]
+
+    async def test_full_scrape_sets_channel_metadata(
+        self, bot: ArchiverBot, session: AsyncSession
+    ) -> None:
+        """Test that a first scrape records the message range and count."""
+        channel = FakeChannel(5)
+
+        await bot._scrape_channel(session, channel)
+
+        assert channel.history_calls == [None]
+        row = await _channel_row(session)
+        assert (row.first_message_id, row.last_message_id, row.message_count) == (1, 5, 5)
+
+    async def test_rescrape_reads_after_high_water_mark(
+        self, bot: ArchiverBot, session: AsyncSession
+    ) -> None:
+        """Test that a re-scrape only fetches and counts newer messages."""
+        channel = FakeChannel(5)
+        await bot._scrape_channel(session, channel)
+        channel.add_messages(3)
+
+        stats = await bot._scrape_channel(session, channel, prev_last_id=5)
+
+        assert stats["messages"] == 3
+        assert channel.history_calls == [None, 5]
+        row = await _channel_row(session)
+        # The incremental pass doesn't see the oldest message, so keeps it
+        assert (row.first_message_id, row.last_message_id, row.message_count) == (1, 8, 8)
+
+    async def test_idle_channel_skips_history(
+        self, bot: ArchiverBot, session: AsyncSession
+    ) -> None:
+        """Test that no history request is made when nothing is newer."""
+        channel = FakeChannel(5)
+
+        stats = await bot._scrape_channel(session, channel, prev_last_id=5)
+
+        assert stats == {"messages": 0, "attachments": 0}
+        assert channel.history_calls == []
+        # Still recorded as checked, without touching the message metadata
+        row = await _channel_row(session)
+        assert row.last_scraped_at is not None
+        assert row.message_count == 0
+
+    async def test_progress_reports_final_count(
+        self, bot: ArchiverBot, session: AsyncSession
+    ) -> None:
+        """Test that progress is reported at intervals and once at the end."""
+        calls: list[tuple[str, int]] = []
+
+        await bot._scrape_channel(
+            session,
+            FakeChannel(scraper.PROGRESS_INTERVAL + 5),
+            lambda name, count: calls.append((name, count)),
+        )
+
+        assert calls == [
+            ("general", scraper.PROGRESS_INTERVAL),
+            ("general", scraper.PROGRESS_INTERVAL + 5),
+        ]
+
+
+class TestMessageRow:
+    """Tests for ArchiverBot._message_row."""
+
+    def test_plain_content_skips_clean_content(self, bot: ArchiverBot) -> None:
+        """Test that content without mentions is used as clean_content."""
+        message = _message(FakeChannel(0), 1, content="hello")
+        row = bot._message_row(message, datetime.now(UTC))  # type: ignore[arg-type]
+        assert row["clean_content"] == "hello"
+
+    @pytest.mark.parametrize("content", ["hi <@123>", "hi @everyone"])
+    def test_mentions_use_clean_content(self, bot: ArchiverBot, content: str) -> None:
+        """Test that content with mentions goes through clean_content."""
+        message = _message(FakeChannel(0), 1, content=content)
+        row = bot._message_row(message, datetime.now(UTC))  # type: ignore[arg-type]
+        assert row["clean_content"] == f"clean:{content}"
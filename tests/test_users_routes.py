@@ -0,0 +1,123 @@
+"""Tests for the user API routes."""
+
+from datetime import UTC, datetime
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from wumpus_archiver.api.routes import users
+from wumpus_archiver.api.schemas import UserListResponse
+from wumpus_archiver.models.channel import Channel
+from wumpus_archiver.models.guild import Guild
+from wumpus_archiver.models.message import Message
+from wumpus_archiver.models.user import User
+from wumpus_archiver.storage.database import Database
+
+GUILD_ID = 100
+CHANNEL_ID = 200
+
+
+@pytest.fixture
+def request_(database: Database, monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """Create a request stand-in carrying the app state the routes read."""
+    monkeypatch.setattr(users, "_user_list_cache", {})
+    manager = SimpleNamespace(data_version=0)
+    return SimpleNamespace(
+        app=SimpleNamespace(state=SimpleNamespace(database=database, scrape_manager=manager))
+    )
+
+
+async def _add_message(session: AsyncSession, message_id: int, user_id: int) -> None:
+    """Archive one message by a new user in the test guild's channel."""
+    if await session.get(Guild, GUILD_ID) is None:
+        session.add(Guild(id=GUILD_ID, name="Guild"))
+        session.add(Channel(id=CHANNEL_ID, guild_id=GUILD_ID, name="general", type=0))
+    now = datetime.now(UTC)
+    session.add(User(id=user_id, username=f"user{user_id}"))
+    session.add(
+        Message(
+            id=message_id,
+            channel_id=CHANNEL_ID,
+            author_id=user_id,
+            content="hi",
+            clean_content="hi",
+            created_at=now,
+            scraped_at=now,
+        )
+    )
+    await session.commit()
+
+
+async def _list_users(request: SimpleNamespace, offset: int = 0) -> UserListResponse:
+    """Call the guild user listing with its default query parameters."""
+    return await users.list_guild_users(
+        request,  # type: ignore[arg-type]
+        GUILD_ID,
+        offset=offset,
+        limit=50,
+        sort="messages",
+        q=None,
+    )
+
+
+class TestUserListCache:
+    """Tests for the guild user listing cache."""
+
+    async def test_repeat_request_served_from_cache(
+        self, request_: SimpleNamespace, session: AsyncSession
+    ) -> None:
+        """Test that a repeated listing skips the database."""
+        await _add_message(session, 1, 10)
+        first = await _list_users(request_)
+
+        await _add_message(session, 2, 11)
+        second = await _list_users(request_)
+
+        assert second is first
+        assert first.total == 1
+
+    async def test_entry_expires_after_ttl(
+        self,
+        request_: SimpleNamespace,
+        session: AsyncSession,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that a listing older than the TTL is rebuilt."""
+        monkeypatch.setattr(users, "USER_LIST_CACHE_TTL", 0.0)
+        await _add_message(session, 1, 10)
+        await _list_users(request_)
+
+        await _add_message(session, 2, 11)
+        response = await _list_users(request_)
+
+        assert response.total == 2
+
+    async def test_scrape_invalidates_entries(
+        self, request_: SimpleNamespace, session: AsyncSession
+    ) -> None:
+        """Test that a bumped data version bypasses earlier entries."""
+        await _add_message(session, 1, 10)
+        await _list_users(request_)
+
+        await _add_message(session, 2, 11)
+        request_.app.state.scrape_manager.data_version += 1
+        response = await _list_users(request_)
+
+        assert response.total == 2
+
+    async def test_oldest_entry_evicted_at_capacity(
+        self,
+        request_: SimpleNamespace,
+        session: AsyncSession,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that the cache stays bounded by dropping its oldest page."""
+        monkeypatch.setattr(users, "USER_LIST_CACHE_MAX", 2)
+        await _add_message(session, 1, 10)
+
+        for offset in range(3):
+            await _list_users(request_, offset=offset)
+
+        offsets = [key[3] for key in users._user_list_cache]
+        assert offsets == [1, 2]